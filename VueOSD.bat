@@ -3,11 +3,16 @@ cd /d "%~dp0"
 title VueOSD — Digital FPV OSD Tool
 
 set SFPATH=%TEMP%\vueosd_splash.txt
+set DEPSOK=%LOCALAPPDATA%\VueOSD\deps.ok
 
 :: ── Write initial status and launch HTA splash immediately ───────────────────
-echo 2>&1>"%SFPATH%" 5
-echo Starting^&hellip;>>"%SFPATH%"
-start "" mshta.exe "%~dp0assets\splash.hta"
+:: Skipped on warm starts (bootstrap.py wrote deps.ok): the Qt splash comes up
+:: straight away, so the HTA would only flash before being closed again.
+if not exist "%DEPSOK%" (
+    echo 2>&1>"%SFPATH%" 5
+    echo Starting^&hellip;>>"%SFPATH%"
+    start "" mshta.exe "%~dp0assets\splash.hta"
+)
 
 :: ── Check for Python ──────────────────────────────────────────────────────────
 set PYTHON=
@@ -18,6 +23,11 @@ if "%PYTHON%"=="" python --version >nul 2>&1 && set PYTHON=python
 if "%PYTHON%"=="" (
     echo 12>"%SFPATH%"
     echo Installing Python 3^&hellip;>>"%SFPATH%"
+    rem A fresh interpreter has no packages: void the warm-start sentinel and bring up the HTA it skipped
+    if exist "%DEPSOK%" (
+        del "%DEPSOK%" >nul 2>&1
+        start "" mshta.exe "%~dp0assets\splash.hta"
+    )
     winget install --id Python.Python.3.13 --source winget --accept-package-agreements --accept-source-agreements >nul 2>&1
 
     echo 40>"%SFPATH%"
@@ -38,8 +48,10 @@ if "%PYTHON%"=="" (
 )
 
 :: ── Hand off to bootstrap — it closes the HTA and shows PyQt6 splash ─────────
-echo 45>"%SFPATH%"
-echo Loading app^&hellip;>>"%SFPATH%"
+if not exist "%DEPSOK%" (
+    echo 45>"%SFPATH%"
+    echo Loading app^&hellip;>>"%SFPATH%"
+)
 
 %PYTHON% "%~dp0bootstrap.py"
 
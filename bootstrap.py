@@ -1,12 +1,23 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2024-2025 VueOSD — https://github.com/wkumik/Digital-FPV-OSD-Tool
-import sys, os, subprocess, threading, shutil, traceback, time
+import sys, os, subprocess
 
 HERE    = os.path.dirname(os.path.abspath(__file__))
 PYTHON  = sys.executable
 SFPATH  = os.path.join(os.environ.get("TEMP", HERE), "vueosd_splash.txt")
 
 
+def _hidden_run(*args, **kwargs):
+    """subprocess.run wrapper that never shows a console window on Windows."""
+    if sys.platform == "win32":
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = subprocess.SW_HIDE
+        kwargs.setdefault("startupinfo", si)
+        kwargs.setdefault("creationflags", subprocess.CREATE_NO_WINDOW)
+    return subprocess.run(*args, **kwargs)
+
+
 def _show_error(msg):
     try:
         import tkinter as tk
@@ -27,6 +38,14 @@ def _hta_step(prog, msg):
         pass
 
 
+def _hta_start():
+    """Launch the HTA splash (VueOSD.bat normally does this on a cold start)."""
+    try:
+        subprocess.Popen(["mshta.exe", os.path.join(HERE, "assets", "splash.hta")])
+    except Exception:
+        pass
+
+
 def _hta_close():
     """Tell the HTA to close itself."""
     try:
@@ -40,28 +59,95 @@ def _hta_close():
 if sys.platform == "win32" and "pythonw" not in PYTHON.lower():
     pythonw = os.path.join(os.path.dirname(PYTHON), "pythonw.exe")
     if os.path.exists(pythonw):
-        subprocess.Popen([pythonw, os.path.abspath(__file__)] + sys.argv[1:],
-                         cwd=HERE)
-        sys.exit(0)
+        # Replace this process rather than spawning a second one. The MSVCRT
+        # exec joins argv with spaces, so each argument has to be quoted.
+        os.chdir(HERE)
+        os.execv(pythonw, [f'"{a}"' for a in
+                           [pythonw, os.path.abspath(__file__), *sys.argv[1:]]])
     # pythonw not found — continue under python.exe (console visible but functional)
 
 
+# (pip distribution name, import name) for every runtime dependency
+_DEPS = (("PyQt6", "PyQt6"), ("Pillow", "PIL"), ("numpy", "numpy"))
+
+
 def _pip(*packages):
-    subprocess.run([PYTHON, "-m", "pip", "install", "--user", "--quiet",
-                    *packages], check=False)
+    _hidden_run([PYTHON, "-m", "pip", "install", "--user", "--quiet",
+                 *packages], check=False)
+    # Make fresh installs visible to the in-process find_spec probes
+    import importlib, site
+    user_site = site.getusersitepackages()
+    if user_site not in sys.path:
+        site.addsitedir(user_site)
+    importlib.invalidate_caches()
 
 
 def _has(*packages):
+    """True if every package is importable — a finder lookup, no child interpreter."""
+    from importlib.util import find_spec
+    try:
+        return all(find_spec(p) is not None for p in packages)
+    except (ImportError, ValueError):
+        return False
+
+
+def _missing():
+    """Return the pip names of all dependencies that are not importable."""
+    return [pkg for pkg, mod in _DEPS if not _has(mod)]
+
+
+def _deps_cache_path():
+    base = (os.environ.get("LOCALAPPDATA")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "VueOSD", "deps.ok")
+
+
+def _deps_stamp():
+    """Identify the interpreter — a Python upgrade invalidates the sentinel."""
+    return f"{sys.version}\n{os.path.getmtime(PYTHON)}"
+
+
+def _deps_cached():
+    """True if a previous launch verified every dependency with this interpreter."""
     try:
-        r = subprocess.run([PYTHON, "-c", "import " + ",".join(packages)],
-                           capture_output=True, timeout=10)
-        return r.returncode == 0
+        with open(_deps_cache_path(), encoding="utf-8") as f:
+            return f.read() == _deps_stamp()
     except Exception:
         return False
 
 
+def _mark_deps_ok():
+    try:
+        path = _deps_cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_deps_stamp())
+    except Exception:
+        pass
+
+
+def _clear_deps_ok():
+    try:
+        os.remove(_deps_cache_path())
+    except Exception:
+        pass
+
+
 def _ffmpeg_ok():
-    return shutil.which("ffmpeg") is not None
+    if sys.platform != "win32":
+        import shutil
+        return shutil.which("ffmpeg") is not None
+    # One attribute query per PATH entry instead of which()'s stat per PATHEXT
+    import ctypes
+    get_attrs = ctypes.windll.kernel32.GetFileAttributesW
+    get_attrs.restype = ctypes.c_uint32
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        if not d:
+            continue
+        attrs = get_attrs(os.path.join(d.strip('"'), "ffmpeg.exe"))
+        if attrs != 0xFFFFFFFF and not attrs & 0x10:   # INVALID / DIRECTORY
+            return True
+    return False
 
 
 def _refresh_path_from_registry():
@@ -88,8 +174,10 @@ def _refresh_path_from_registry():
 
 
 def _run_in_thread_with_progress(fn, app, splash, start_prog, end_prog, label):
-    """Run fn() in a thread. Poll every 33ms keeping the PyQt6 animation smooth."""
-    done  = [False]
+    """Run fn() in a thread while a local Qt event loop keeps the splash animating."""
+    import threading
+    from PyQt6.QtCore import QTimer, QEventLoop
+    done  = threading.Event()
     error = [None]
 
     def _worker():
@@ -98,24 +186,53 @@ def _run_in_thread_with_progress(fn, app, splash, start_prog, end_prog, label):
         except Exception as e:
             error[0] = e
         finally:
-            done[0] = True
+            done.set()
 
     threading.Thread(target=_worker, daemon=True).start()
 
-    prog = start_prog
-    while not done[0]:
-        prog = min(end_prog, prog + (end_prog - start_prog) * 0.015)
-        splash.set_progress(prog, label)
-        app.processEvents()
-        time.sleep(0.033)
+    loop = QEventLoop()
+    prog = [start_prog]
+
+    def _tick():
+        if done.is_set():
+            loop.quit()
+            return
+        prog[0] = min(end_prog, prog[0] + (end_prog - start_prog) * 0.015)
+        splash.set_progress(prog[0], label)
+
+    timer = QTimer()
+    timer.timeout.connect(_tick)
+    timer.start(33)
+    if not done.is_set():
+        loop.exec()
+    timer.stop()
 
     if error[0]:
         raise error[0]
 
 
-def _run_with_splash():
+def _prewarm_qt():
+    """Start importing PyQt6 in the background while the HTA is still up.
+
+    The import lock makes this safe: _run_with_splash's own imports either find
+    the modules already in sys.modules or wait for this thread to finish them.
+    """
+    import threading
+
+    def _import():
+        try:
+            import PyQt6.QtWidgets, PyQt6.QtGui  # noqa: F401
+        except Exception:
+            pass
+
+    threading.Thread(target=_import, daemon=True).start()
+
+
+def _run_with_splash(missing=(), deps_ok=False):
     # ── Close the HTA — PyQt6 splash takes over immediately ───────────────────
-    _hta_close()
+    # (on a warm start VueOSD.bat never launched it, so there is nothing to close)
+    if not deps_ok:
+        _hta_close()
 
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtGui     import QIcon
@@ -146,38 +263,41 @@ def _run_with_splash():
         splash.set_progress(v, msg)
         app.processEvents()
 
-    step(0.04, "Checking dependencies…")
-
-    if not _has("PIL"):
-        step(0.08, "Installing Pillow…")
-        _run_in_thread_with_progress(
-            lambda: _pip("Pillow"), app, splash, 0.08, 0.18, "Installing Pillow…")
-
-    step(0.18, "Checking NumPy…")
-    if not _has("numpy"):
-        _run_in_thread_with_progress(
-            lambda: _pip("numpy"), app, splash, 0.18, 0.28, "Installing NumPy…")
-
-    step(0.28, "Checking FFmpeg…")
-
-    if sys.platform == "win32" and not _ffmpeg_ok():
-        def _install_ffmpeg():
-            try:
-                subprocess.run(
-                    ["winget", "install", "--id", "Gyan.FFmpeg",
-                     "--source", "winget",
-                     "--accept-package-agreements",
-                     "--accept-source-agreements"],
-                    capture_output=True, timeout=180)
-            except Exception:
-                pass
-            _refresh_path_from_registry()
-
-        _run_in_thread_with_progress(
-            _install_ffmpeg, app, splash, 0.28, 0.58,
-            "Installing FFmpeg (one-time, may take a minute)…")
-
-        step(0.58, "FFmpeg ready" if _ffmpeg_ok() else "FFmpeg install failed")
+    if deps_ok:
+        step(0.28, "Dependencies ready")
+    else:
+        step(0.04, "Checking dependencies…")
+
+        if missing:
+            # One pip run for everything — a single resolver pass, one start-up
+            label = f"Installing {', '.join(missing)}…"
+            step(0.08, label)
+            _run_in_thread_with_progress(
+                lambda: _pip(*missing), app, splash, 0.08, 0.28, label)
+
+        step(0.28, "Checking FFmpeg…")
+
+        if sys.platform == "win32" and not _ffmpeg_ok():
+            def _install_ffmpeg():
+                try:
+                    _hidden_run(
+                        ["winget", "install", "--id", "Gyan.FFmpeg",
+                         "--source", "winget",
+                         "--accept-package-agreements",
+                         "--accept-source-agreements"],
+                        capture_output=True, timeout=180)
+                except Exception:
+                    pass
+                _refresh_path_from_registry()
+
+            _run_in_thread_with_progress(
+                _install_ffmpeg, app, splash, 0.28, 0.58,
+                "Installing FFmpeg (one-time, may take a minute)…")
+
+            step(0.58, "FFmpeg ready" if _ffmpeg_ok() else "FFmpeg install failed")
+
+        if not _missing() and (sys.platform != "win32" or _ffmpeg_ok()):
+            _mark_deps_ok()
 
     step(0.62, "Loading OSD parser…")
     step(0.70, "Loading font engine…")
@@ -185,12 +305,13 @@ def _run_with_splash():
     step(0.86, "Building interface…")
     app.processEvents()
 
-    import types
-    mod = types.ModuleType("vueosd_main")
-    mod.__file__ = os.path.join(HERE, "main.py")
-    with open(mod.__file__, encoding="utf-8") as fh:
-        src = fh.read()
-    exec(compile(src, mod.__file__, "exec"), mod.__dict__)
+    # A real loader (unlike exec of the source) reads/writes __pycache__
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        "vueosd_main", os.path.join(HERE, "main.py"))
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
     MainWindow = mod.MainWindow
 
     app.processEvents()
@@ -206,21 +327,35 @@ def _run_with_splash():
 
 def main():
     try:
-        _hta_step(45, "Checking Python packages…")
-
-        if not _has("PyQt6"):
-            _hta_step(48, "Installing PyQt6 (one-time, ~80 MB)…")
-            _pip("PyQt6")
+        if _deps_cached():
+            _run_with_splash(deps_ok=True)
+            return
 
-        if not _has("PyQt6"):
+        _hta_step(45, "Checking Python packages…")
+        if sys.platform == "win32" and os.path.exists(_deps_cache_path()):
+            # Stale sentinel (e.g. after a Python upgrade): VueOSD.bat trusted it
+            # and skipped the HTA, but a pip install may now run — show progress
+            _hta_start()
+
+        missing = _missing()
+        if "PyQt6" in missing:
+            # No Qt yet, so install everything now under the HTA splash
+            _hta_step(48, "Installing Python packages (one-time, ~80 MB)…")
+            _pip(*missing)
+            missing = _missing()
+
+        if "PyQt6" in missing:
             _hta_close()
             _show_error("Could not install PyQt6.\n\n"
                         "Check your internet connection and try again.")
             sys.exit(1)
 
-        _run_with_splash()
+        _prewarm_qt()
+        _run_with_splash(missing)
 
     except Exception:
+        import traceback
+        _clear_deps_ok()   # re-probe everything on the next launch
         _hta_close()
         _show_error("VueOSD failed to start:\n\n"
                     + traceback.format_exc())
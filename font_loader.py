@@ -33,6 +33,8 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
+import numpy as np
+
 try:
     from PIL import Image
     PIL_OK = True
@@ -41,6 +43,10 @@ except ImportError:
 
 NUM_CHARS = 256   # rows in every font sheet
 
+# Sheets up to this many RGBA bytes are decoded once into an array and
+# sliced per glyph; bigger ones fall back to a PIL crop + convert per glyph
+_SHEET_ARRAY_MAX = 16 * 1024 * 1024
+
 # Firmware prefixes used in folder names
 FIRMWARE_PREFIXES: Dict[str, List[str]] = {
     "Betaflight": ["BTFL_", "BFx4_"],
@@ -49,14 +55,27 @@ FIRMWARE_PREFIXES: Dict[str, List[str]] = {
     "Quicksilver":["SNEAKY_FPV_QS_"],
 }
 
+# Lower-cased prefix tuples so one C-level str.startswith() tests them all
+_FW_PREFIXES_LC: Dict[str, Tuple[str, ...]] = {
+    fw: tuple(p.lower() for p in ps) for fw, ps in FIRMWARE_PREFIXES.items()
+}
+
 _FONTS_DIR = Path(__file__).parent / "fonts"
 
 _HD_FILENAMES = ("font_btfl_hd.png", "font_inav_hd.png", "font_ardu_hd.png", "font_quic_hd.png")
 _SD_FILENAMES = ("font_btfl.png",    "font_inav.png",    "font_ardu.png",    "font_quic.png")
+_PRIO_HD = _HD_FILENAMES + _SD_FILENAMES
+_PRIO_SD = _SD_FILENAMES + _HD_FILENAMES
 
 # Standard base tile widths for single-column fonts
 _STANDARD_BASE_TILE_W = {36, 24, 48, 72}
 
+# tile_h → base tile width (2:3 glyph aspect), see _detect_layout()
+_BASE_W_BY_TILEH: Dict[int, int] = {36: 24, 54: 36, 72: 48, 108: 72}
+# Widths tried for non-standard tile heights — widest first, so a narrow
+# divisor can't split one wide glyph into several bogus columns
+_FALLBACK_BW = (72, 48, 36, 24)
+
 
 class OsdFont:
     """
@@ -71,27 +90,55 @@ class OsdFont:
                  tile_w: int, tile_h: int,
                  n_cols: int = 1,
                  name: str = ""):
-        self.image  = image.convert("RGBA")
+        self._raw   = image   # converted per glyph; the full sheet stays undecoded
+        self._rgba: Optional["Image.Image"] = None
+        # code → cropped RGBA glyph (or None when out of range); callers
+        # never mutate glyphs in place, so cached images are shared
+        self._glyphs: Dict[int, Optional["Image.Image"]] = {}
+        self._arr: Optional[np.ndarray] = None   # H×W×4 sheet, built on first miss
         self.tile_w = tile_w
         self.tile_h = tile_h
         self.n_cols = n_cols
         self.name   = name
 
+    @property
+    def image(self) -> "Image.Image":
+        """The whole sheet as RGBA — converted on first access only."""
+        if self._rgba is None:
+            self._rgba = self._raw.convert("RGBA")
+        return self._rgba
+
     def get_char(self, code: int) -> Optional["Image.Image"]:
         """Return the RGBA glyph image for char code (may be > 255)."""
         if not PIL_OK:
             return None
+        if code in self._glyphs:
+            return self._glyphs[code]
+        glyph = self._glyphs[code] = self._crop(code)
+        return glyph
+
+    def _crop(self, code: int) -> Optional["Image.Image"]:
         col = code // NUM_CHARS   # which column group (0 = chars 0-255)
         row = code % NUM_CHARS    # which row
         if col >= self.n_cols:
             col = 0               # fall back to first column
         x = col * self.tile_w
         y = row * self.tile_h
-        if y + self.tile_h > self.image.height:
+        if y + self.tile_h > self._raw.height:
             return None
-        if x + self.tile_w > self.image.width:
+        if x + self.tile_w > self._raw.width:
             return None
-        return self.image.crop((x, y, x + self.tile_w, y + self.tile_h))
+        arr = self._sheet_array()
+        if arr is not None:
+            return Image.fromarray(arr[y:y + self.tile_h, x:x + self.tile_w])
+        return self._raw.crop((x, y, x + self.tile_w, y + self.tile_h)).convert("RGBA")
+
+    def _sheet_array(self) -> Optional[np.ndarray]:
+        """Decode the sheet once so every later glyph is just an array slice."""
+        if (self._arr is None
+                and self._raw.width * self._raw.height * 4 <= _SHEET_ARRAY_MAX):
+            self._arr = np.asarray(self._raw.convert("RGBA"))
+        return self._arr
 
     def __repr__(self):
         return (f"OsdFont({self.name!r}, tile={self.tile_w}×{self.tile_h}, "
@@ -118,19 +165,14 @@ def _detect_layout(img: "Image.Image") -> Tuple[int, int, int]:
       col 3: chars 768–1023
     """
     tile_h = img.height // NUM_CHARS
-
-    _BASE_W: dict[int, int] = {36: 24, 54: 36, 72: 48, 108: 72}
-    base_w = _BASE_W.get(tile_h)
+    base_w = _BASE_W_BY_TILEH.get(tile_h)
 
     if base_w and img.width % base_w == 0:
         return base_w, tile_h, img.width // base_w
 
     # Fallback for non-standard tile heights
-    for bw in (24, 36, 48, 72):
-        if img.width % bw == 0:
-            return bw, tile_h, img.width // bw
-
-    return img.width, tile_h, 1
+    bw = next((bw for bw in _FALLBACK_BW if img.width % bw == 0), img.width)
+    return bw, tile_h, img.width // bw
 
 
 def load_font_from_file(path: str) -> Optional[OsdFont]:
@@ -149,49 +191,85 @@ def load_font_from_file(path: str) -> Optional[OsdFont]:
 # ── Font database ────────────────────────────────────────────────────────────
 
 def _firmware_of(folder_name: str) -> str:
-    for fw, prefixes in FIRMWARE_PREFIXES.items():
-        for p in prefixes:
-            if folder_name.upper().startswith(p.upper()):
-                return fw
-    return "Other"
+    n = folder_name.lower()
+    return next((fw for fw, ps in _FW_PREFIXES_LC.items() if n.startswith(ps)),
+                "Other")
+
+
+# (fonts/ mtime_ns, scan result) — rescanned only when fonts/ itself changes
+_scan_cache: Optional[Tuple[int, Dict[str, Path]]] = None
+
+
+def invalidate_font_cache() -> None:
+    """Force the next scan_fonts() call to walk the fonts directory again."""
+    global _scan_cache
+    _scan_cache = None
 
 
 def scan_fonts() -> Dict[str, Path]:
-    """Return {folder_name: folder_path} for all font dirs that contain a PNG."""
+    """Return {folder_name: folder_path} for all font dirs that contain a PNG.
+
+    Entries come in directory-listing order; callers that show them sort at
+    the UI boundary.
+    """
+    global _scan_cache
     result: Dict[str, Path] = {}
-    if not _FONTS_DIR.is_dir():
+    try:
+        mtime = os.stat(_FONTS_DIR).st_mtime_ns
+    except OSError:
+        return result
+    if _scan_cache is not None and _scan_cache[0] == mtime:
+        return dict(_scan_cache[1])
+    try:
+        with os.scandir(_FONTS_DIR) as it:
+            entries = [e for e in it if e.is_dir()]
+    except OSError:
         return result
-    for d in sorted(_FONTS_DIR.iterdir()):
-        if d.is_dir() and any(f.suffix.lower() == '.png' for f in d.iterdir()):
-            result[d.name] = d
-    return result
+    for d in entries:
+        try:
+            with os.scandir(d.path) as sub:
+                if any(f.name.lower().endswith('.png') for f in sub):
+                    result[d.name] = Path(d.path)
+        except OSError:
+            pass
+    _scan_cache = (mtime, result)
+    return dict(result)
 
 
 def fonts_by_firmware(firmware: str) -> Dict[str, Path]:
     """Return font dirs whose name starts with the given firmware's prefix(es)."""
     all_fonts = scan_fonts()
-    prefixes  = [p.upper() for p in FIRMWARE_PREFIXES.get(firmware, [])]
+    prefixes  = _FW_PREFIXES_LC.get(firmware)
     if not prefixes:
         return all_fonts
     return {
         name: path
         for name, path in all_fonts.items()
-        if any(name.upper().startswith(p) for p in prefixes)
+        if name.lower().startswith(prefixes)
     }
 
 
 def load_font(folder: Path, prefer_hd: bool = True) -> Optional[OsdFont]:
     """Load HD or SD PNG from a font folder."""
-    if not folder.is_dir():
+    priority = _PRIO_HD if prefer_hd else _PRIO_SD
+    files: Dict[str, str] = {}
+    first_png: Optional[str] = None
+    try:
+        with os.scandir(folder) as it:
+            for f in it:
+                lname = f.name.lower()
+                if lname.endswith('.png'):
+                    files[lname] = f.path
+                    if first_png is None:
+                        first_png = f.path
+                    if lname == priority[0]:
+                        break   # top choice found — no need to list the rest
+    except OSError:
         return None
-    files = {f.name.lower(): f for f in folder.iterdir() if f.suffix.lower() == '.png'}
-    priority = (_HD_FILENAMES if prefer_hd else _SD_FILENAMES) + \
-               (_SD_FILENAMES if prefer_hd else _HD_FILENAMES)
     for name in priority:
         if name in files:
-            return load_font_from_file(str(files[name]))
-    pngs = [f for f in folder.iterdir() if f.suffix.lower() == '.png']
-    return load_font_from_file(str(pngs[0])) if pngs else None
+            return load_font_from_file(files[name])
+    return load_font_from_file(first_png) if first_png else None
 
 
 def list_firmware_names() -> List[str]:
@@ -5,7 +5,8 @@ VueOSD — Digital FPV OSD Tool
 Parse and overlay MSP-OSD data onto FPV DVR video footage.
 """
 
-import sys, os, math, threading, subprocess, tempfile, json, random
+import sys, os, io, re, math, bisect, time, threading, subprocess, json, random, functools, dataclasses
+from concurrent.futures import ThreadPoolExecutor
 
 # ── Windows: set AppUserModelID so taskbar shows our icon, not Python's ───────
 if sys.platform == "win32":
@@ -25,8 +26,10 @@ from PyQt6.QtWidgets import (
     QSizePolicy, QSplitter, QScrollArea, QSpinBox, QFrame,
     QDialog, QLineEdit,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QRect, QUrl
-from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QColor, QPen, QIcon, QDesktopServices
+from PyQt6.QtCore import (Qt, QThread, QThreadPool, QRunnable, pyqtSignal, QTimer,
+                          QRect, QUrl, QEvent)
+from PyQt6.QtGui import (QFont, QPixmap, QImage, QPainter, QColor, QPen, QIcon,
+                         QDesktopServices, QLinearGradient, QGradient)
 
 
 from srt_parser    import parse_srt, SrtFile
@@ -35,9 +38,15 @@ from p1_osd_parser import detect_p1, parse_p1_osd, p1_to_osd_file
 from font_loader   import (fonts_by_firmware, load_font, load_font_from_file,
                            OsdFont, FIRMWARE_PREFIXES)
 from osd_renderer  import OsdRenderConfig, render_osd_frame, render_fallback
-from video_processor import ProcessingConfig, process_video, get_video_info, find_ffmpeg, detect_hw_encoder
+from video_processor import (ProcessingConfig, process_video, get_video_info, find_ffmpeg,
+                             detect_hw_encoder, RenderCancelled)
 from splash_screen   import SplashScreen
 
+# Resolved once — these paths are hit on every icon build and theme rebuild
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_ICONS_DIR  = os.path.join(_MODULE_DIR, "icons")
+_ASSETS_DIR = os.path.join(_MODULE_DIR, "assets")
+
 
 _DONATE_URL = "https://buymeacoffee.com/failsavefpv"
 
@@ -96,174 +105,343 @@ _DARK_THEME = True   # module-level flag; toggled by the theme button
 VERSION = "1.1"
 
 _UI_SCALE = 1.0
-_SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
+_SETTINGS_FILE = os.path.join(_MODULE_DIR, "settings.json")
 
+@functools.lru_cache(maxsize=64)
 def _fs(n: int) -> int:
-    """Scale a font size by the active UI scale factor."""
+    """Scale a font size by the active UI scale factor (cleared by _set_ui_scale)."""
     return max(6, int(n * _UI_SCALE))
 
+@functools.lru_cache(maxsize=None)
+def _ui_font(size: int, bold: bool = False) -> QFont:
+    """Shared Segoe UI font; QFont is implicitly shared, so setFont() copies are free."""
+    return QFont("Segoe UI", size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
 _OSD_OFFSET_MS = 0  # persisted OSD sync offset (ms)
 
+_SETTINGS: dict = {}   # full settings.json contents, kept in memory
+_save_timer = None     # created lazily — needs a running QApplication
+
 def _load_settings():
     global _UI_SCALE, _OSD_OFFSET_MS
     try:
         with open(_SETTINGS_FILE) as f:
-            data = json.load(f)
-        _UI_SCALE      = float(data.get("ui_scale", 1.0))
-        _OSD_OFFSET_MS = int(data.get("osd_offset_ms", 0))
+            _SETTINGS.update(json.load(f))
+        _UI_SCALE      = float(_SETTINGS.get("ui_scale", 1.0))
+        _OSD_OFFSET_MS = int(_SETTINGS.get("osd_offset_ms", 0))
     except Exception:
         pass
 
 def _save_settings():
+    """Schedule a settings write; a burst of changes is written once, 500 ms later."""
+    global _save_timer
+    if (_SETTINGS.get("ui_scale") == _UI_SCALE
+            and _SETTINGS.get("osd_offset_ms") == _OSD_OFFSET_MS):
+        return   # nothing changed (e.g. widgets being restored from settings)
+    _SETTINGS["ui_scale"]      = _UI_SCALE
+    _SETTINGS["osd_offset_ms"] = _OSD_OFFSET_MS
+    if _save_timer is None:
+        _save_timer = QTimer()
+        _save_timer.setSingleShot(True)
+        _save_timer.setInterval(500)
+        _save_timer.timeout.connect(_do_save_settings)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_flush_settings)
+    _save_timer.start()
+
+def _flush_settings():
+    """Write immediately if a save is still pending (e.g. on quit)."""
+    if _save_timer is not None and _save_timer.isActive():
+        _save_timer.stop()
+        _do_save_settings()
+
+def _do_save_settings():
     try:
-        data: dict = {}
-        try:
-            with open(_SETTINGS_FILE) as f:
-                data = json.load(f)
-        except Exception:
-            pass
-        data["ui_scale"]      = _UI_SCALE
-        data["osd_offset_ms"] = _OSD_OFFSET_MS
         with open(_SETTINGS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+            json.dump(_SETTINGS, f, indent=2)
     except Exception:
         pass
 
 _load_settings()
 
+_ACTIVE_THEME: dict = _theme_mod.get_dark()   # refreshed by _build_styles()
+
 def _T() -> dict:
-    """Return the active theme palette (reads live from theme.py)."""
-    return _theme_mod.get_dark() if _DARK_THEME else _theme_mod.get_light()
+    """Return the active theme palette (cached; see _build_styles)."""
+    return _ACTIVE_THEME
+
+
+# ── Stylesheet templates ──────────────────────────────────────────────────────
+# Placeholders are theme tokens ({bg}, {accent}…) plus the derived values
+# _build_styles() adds: fsN (scaled font sizes), title_col, btn_border,
+# checked_fg.  Literal QSS braces are doubled.
+
+_APP_STYLE_TMPL = (
+    "QMainWindow,QWidget{{background:{bg};color:{text};"
+    "font-family:'Segoe UI',Arial,sans-serif;font-size:{fs12}px;}}"
+    "QLabel{{color:{text};}}"
+    "QCheckBox{{color:{text};font-size:{fs11}px;}}"
+    "QScrollArea{{border:none;}}"
+    "QScrollArea#leftScroll{{background:transparent;}}"
+    "QScrollArea#leftScroll QScrollBar:vertical{{background:{bg};width:6px;border-radius:3px;}}"
+    "QScrollArea#leftScroll QScrollBar::handle:vertical{{background:{surface2};border-radius:3px;}}"
+    "QSpinBox{{background:{surface};color:{text};"
+    "border:1px solid {border2};border-radius:4px;padding:3px 6px;}}"
+    "QSpinBox::up-button,QSpinBox::down-button{{width:16px;"
+    "background:{surface2};border-radius:2px;}}"
+    "QFrame[role=\"divider\"]{{color:{border};}}"
+    # Window labels tagged with a "role" property (see _set_role)
+    "QLabel[role=\"title\"]{{color:{text};}}"
+    "QLabel[role=\"version\"]{{color:{muted};}}"
+    "QLabel[role=\"header\"]{{color:{subtext};}}"
+    "QLabel[role=\"field\"]{{color:{subtext};font-size:{fs11}px;}}"
+    "QLabel[role=\"text\"]{{color:{text};font-size:{fs11}px;}}"
+    "QLabel[role=\"value\"]{{color:{text};font-size:{fs11}px;font-weight:bold;}}"
+    "QLabel[role=\"time\"]{{color:{subtext};font-size:{fs10}px;font-weight:bold;}}"
+    "QLabel[role=\"hint\"]{{color:{muted};font-size:{fs10}px;}}"
+    "QLabel[role=\"credit\"]{{color:{muted};font-size:8px;}}"
+    "QLabel[role=\"warn\"]{{color:{orange};font-size:{fs10}px;}}"
+    "QLabel[role=\"ok\"]{{color:{green};font-size:{fs10}px;}}"
+    "QLabel[role=\"error\"]{{color:{red};font-size:{fs10}px;}}"
+    # Text inputs (overwrite dialog) — "error" flags a rejected value
+    "QLineEdit[role=\"field\"]{{background:{bg2};color:{text};border:1px solid {border2};"
+    "border-radius:4px;padding:4px 8px;}}"
+    "QLineEdit[role=\"error\"]{{background:{bg2};color:{red};border:1px solid {red};"
+    "border-radius:4px;padding:4px 8px;}}"
+    # FileRow path box — "path" while empty, "pathSet" once a file is chosen
+    "QLabel[role=\"path\"]{{background:{bg2};color:{muted};border:1px solid {border};"
+    "border-radius:4px;padding:3px 8px;font-size:{fs11}px;}}"
+    "QLabel[role=\"pathSet\"]{{background:{bg2};color:{text};border:1px solid {border2};"
+    "border-radius:4px;padding:3px 8px;font-size:{fs11}px;}}"
+    # Shared label roles (set via objectName) — one rule instead of a
+    # stylesheet per FileRow / LabeledSlider / InfoCard label
+    "QLabel#rowName{{color:{subtext};}}"
+    "QLabel#sliderLabel{{color:{subtext};font-size:11px;}}"
+    "QLabel#sliderValue{{color:{text};font-size:11px;font-weight:bold;}}"
+    "QLabel#infoKey{{color:{muted};font-size:10px;}}"
+    "QLabel#infoValue{{color:{text};font-size:10px;font-weight:600;}}"
+)
+_GROUP_STYLE_TMPL = (
+    "QGroupBox{{border:1px solid {border};border-radius:8px;margin-top:8px;"
+    "padding:6px;font-weight:bold;color:{title_col};font-size:{fs11}px;}}"
+    "QGroupBox::title{{subcontrol-origin:margin;left:10px;padding:0 4px;}}"
+)
+_BTN_SEC_TMPL = (
+    "QPushButton{{background:{surface};color:{text};"
+    "border:{btn_border};border-radius:6px;"
+    "padding:3px 10px;font-size:{fs11}px;}}"
+    "QPushButton:hover{{background:{surface2};border:{btn_border};}}"
+    "QPushButton:pressed{{background:{surface3};}}"
+    "QPushButton:disabled{{background:{bg};color:{muted};"
+    "border:1px solid {border};}}"
+    "QPushButton:checked{{background:{accent};color:{checked_fg};border:none;}}"
+)
+# Light: blue fill with white text — clear primary action
+_BTN_PRIMARY_LIGHT_TMPL = (
+    "QPushButton{{background:{accent};color:#ffffff;"
+    "border:none;border-radius:8px;font-weight:bold;}}"
+    "QPushButton:hover{{background:{accent2};}}"
+    "QPushButton:pressed{{background:{accent2};}}"
+    "QPushButton:disabled{{background:{surface3};color:{muted};"
+    "border:1px solid {border};}}"
+)
+# Dark: blue gradient with dark text
+_BTN_PRIMARY_DARK_TMPL = (
+    "QPushButton{{background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
+    "stop:0 {accent},stop:1 {accent2});"
+    "color:{bg};border:none;border-radius:8px;}}"
+    "QPushButton:hover{{background:{accent2};}}"
+    "QPushButton:pressed{{background:{accent};}}"
+    "QPushButton:disabled{{background:{surface};color:{muted};}}"
+)
+_BTN_PLAY_TMPL = (
+    "QPushButton{{background:{surface};color:{text};"
+    "border:{btn_border};border-radius:8px;font-size:{fs15}px;}}"
+    "QPushButton:hover{{background:{surface2};border:{btn_border};}}"
+    "QPushButton:pressed{{background:{accent};color:#ffffff;}}"
+    "QPushButton:disabled{{background:{bg};color:{muted};"
+    "border:1px solid {border};}}"
+)
+_BTN_STOP_TMPL = (
+    "QPushButton{{background:{red};color:#ffffff;"
+    "border:none;border-radius:8px;font-size:{fs16}px;font-weight:bold;}}"
+    "QPushButton:hover{{background:{red}dd;}}"
+    "QPushButton:pressed{{background:{red};}}"
+    "QPushButton:disabled{{background:{surface};color:{muted};"
+    "border:1px solid {border};}}"
+)
+_BTN_DANGER_TMPL = (
+    "QPushButton{{background:{surface};color:{red};"
+    "border:{btn_border};border-radius:6px;font-weight:bold;font-size:{fs11}px;}}"
+    "QPushButton:hover{{background:{red};color:#ffffff;border:none;}}"
+)
+_COMBO_STYLE_TMPL = (
+    "QComboBox{{background:{surface};color:{text};"
+    "border:1px solid {border2};"
+    "border-radius:4px;padding:3px 8px;font-size:{fs11}px;}}"
+    "QComboBox::drop-down{{border:none;padding-right:6px;}}"
+    "QComboBox QAbstractItemView{{background:{bg};color:{text};"
+    "selection-background-color:{surface2};border:1px solid {border2};}}"
+)
+_SLIDER_STYLE_TMPL = (
+    "QSlider::groove:horizontal{{background:{border};height:4px;border-radius:2px;}}"
+    "QSlider::handle:horizontal{{background:{accent};width:14px;height:14px;"
+    "margin:-5px 0;border-radius:7px;}}"
+    "QSlider::sub-page:horizontal{{background:{accent};border-radius:2px;}}"
+)
+_ICON_BTN_TMPL = (
+    "QPushButton{{background:transparent;border:none;border-radius:15px;}}"
+    "QPushButton:hover{{background:{surface};}}"
+)
+_PREVIEW_TMPL = "background:{bg2};border:1px solid {border};border-radius:8px;"
+_DROP_IDLE_TMPL = (
+    "DropZone{{background:{bg2};border:2px dashed {border2};border-radius:8px;}}"
+    "DropZone QLabel{{color:{muted};font-size:11px;}}"
+)
+_DROP_HOVER_TMPL = (
+    "DropZone{{background:{surface};border:2px solid {accent};border-radius:8px;}}"
+    "DropZone QLabel{{color:{accent};font-size:11px;font-weight:bold;}}"
+)
+_PROG_STYLE_TMPL = (
+    "QProgressBar{{background:{surface};border-radius:4px;text-align:center;"
+    "color:{text};font-size:{fs11}px;}}"
+    "QProgressBar::chunk{{background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
+    "stop:0 {accent},stop:1 {accent2});border-radius:4px;}}"
+)
 
+# (is_light, scale, palette contents) → the tuple of stylesheet strings below.
+# Keyed on the palette's contents, not its identity: the theme editor edits
+# the live palette dict in place.
+_STYLE_CACHE: dict = {}
 
 def _build_styles():
     """Rebuild all stylesheet strings from the active theme."""
-    global APP_STYLE, GROUP_STYLE, PATH_EMPTY, PATH_FILLED
+    global APP_STYLE, GROUP_STYLE
     global BTN_SEC, BTN_PRIMARY, BTN_PLAY, BTN_STOP, BTN_DANGER
-    global COMBO_STYLE, SLIDER_STYLE, PROG_STYLE
+    global COMBO_STYLE, SLIDER_STYLE, PROG_STYLE, _ACTIVE_THEME
+    global ICON_BTN_STYLE, PREVIEW_STYLE, DROP_IDLE, DROP_HOVER
+    # Every theme change (toggle, editor apply, scale) passes through here,
+    # so this is the one place the cached palette needs refreshing
+    _ACTIVE_THEME = _theme_mod.get_dark() if _DARK_THEME else _theme_mod.get_light()
     t = _T()
     is_light = not _DARK_THEME
 
-    APP_STYLE = (
-        f"QMainWindow,QWidget{{background:{t['bg']};color:{t['text']};"
-        f"font-family:'Segoe UI',Arial,sans-serif;font-size:{_fs(12)}px;}}"
-        f"QLabel{{color:{t['text']};}}"
-        f"QCheckBox{{color:{t['text']};}}"
-        f"QScrollArea{{border:none;}}"
-    )
-    # Light: group titles use subtext (softer), dark: keep accent (blue)
-    title_col = t['subtext'] if is_light else t['accent']
-    GROUP_STYLE = (
-        f"QGroupBox{{border:1px solid {t['border']};border-radius:8px;margin-top:8px;"
-        f"padding:6px;font-weight:bold;color:{title_col};font-size:{_fs(11)}px;}}"
-        f"QGroupBox::title{{subcontrol-origin:margin;left:10px;padding:0 4px;}}"
-    )
-    PATH_EMPTY  = (f"background:{t['bg2']};color:{t['muted']};border:1px solid {t['border']};"
-                   f"border-radius:4px;padding:3px 8px;font-size:{_fs(11)}px;")
-    PATH_FILLED = (f"background:{t['bg2']};color:{t['text']};border:1px solid {t['border2']};"
-                   f"border-radius:4px;padding:3px 8px;font-size:{_fs(11)}px;")
-
-    # Light theme: buttons use a thin border so they read against the near-white bg
-    # without being dark slabs. Dark theme: no border needed (surfaces contrast enough).
-    btn_border     = f"1px solid {t['border2']}" if is_light else "none"
-    btn_border_hov = f"1px solid {t['border2']}" if is_light else "none"
-
-    BTN_SEC  = (f"QPushButton{{background:{t['surface']};color:{t['text']};"
-                f"border:{btn_border};border-radius:6px;"
-                f"padding:3px 10px;font-size:{_fs(11)}px;}}"
-                f"QPushButton:hover{{background:{t['surface2']};border:{btn_border_hov};}}"
-                f"QPushButton:pressed{{background:{t['surface3']};}}"
-                f"QPushButton:disabled{{background:{t['bg']};color:{t['muted']};"
-                f"border:1px solid {t['border']};}}"
-                f"QPushButton:checked{{background:{t['accent']};color:{'#ffffff' if is_light else t['bg']};border:none;}}")
-    BTN_PRIMARY = (
-        # Light: blue fill with white text — clear primary action
-        # Dark: blue gradient with dark text
-        (f"QPushButton{{background:{t['accent']};color:#ffffff;"
-         f"border:none;border-radius:8px;font-weight:bold;}}"
-         f"QPushButton:hover{{background:{t['accent2']};}}"
-         f"QPushButton:pressed{{background:{t['accent2']};}}"
-         f"QPushButton:disabled{{background:{t['surface3']};color:{t['muted']};"
-         f"border:1px solid {t['border']};}}")
-        if is_light else
-        (f"QPushButton{{background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
-         f"stop:0 {t['accent']},stop:1 {t['accent2']});"
-         f"color:{t['bg']};border:none;border-radius:8px;}}"
-         f"QPushButton:hover{{background:{t['accent2']};}}"
-         f"QPushButton:pressed{{background:{t['accent']};}}"
-         f"QPushButton:disabled{{background:{t['surface']};color:{t['muted']};}}")
-    )
-    BTN_PLAY = (f"QPushButton{{background:{t['surface']};color:{t['text']};"
-                f"border:{btn_border};border-radius:8px;font-size:{_fs(15)}px;}}"
-                f"QPushButton:hover{{background:{t['surface2']};border:{btn_border_hov};}}"
-                f"QPushButton:pressed{{background:{t['accent']};color:#ffffff;}}"
-                f"QPushButton:disabled{{background:{t['bg']};color:{t['muted']};"
-                f"border:1px solid {t['border']};}}")
-    BTN_STOP  = (f"QPushButton{{background:{t['red']};color:#ffffff;"
-                 f"border:none;border-radius:8px;font-size:{_fs(16)}px;font-weight:bold;}}"
-                 f"QPushButton:hover{{background:{t['red']}dd;}}"
-                 f"QPushButton:pressed{{background:{t['red']};}}"
-                 f"QPushButton:disabled{{background:{t['surface']};color:{t['muted']};"
-                 f"border:1px solid {t['border']};}}")
-    BTN_DANGER = (f"QPushButton{{background:{t['surface']};color:{t['red']};"
-                  f"border:{btn_border};border-radius:6px;font-weight:bold;font-size:{_fs(11)}px;}}"
-                  f"QPushButton:hover{{background:{t['red']};color:#ffffff;border:none;}}")
-    COMBO_STYLE = (f"QComboBox{{background:{t['surface']};color:{t['text']};"
-                   f"border:1px solid {t['border2']};"
-                   f"border-radius:4px;padding:3px 8px;font-size:{_fs(11)}px;}}"
-                   f"QComboBox::drop-down{{border:none;padding-right:6px;}}"
-                   f"QComboBox QAbstractItemView{{background:{t['bg']};color:{t['text']};"
-                   f"selection-background-color:{t['surface2']};border:1px solid {t['border2']};}}")
-    SLIDER_STYLE = (f"QSlider::groove:horizontal{{background:{t['border']};height:4px;border-radius:2px;}}"
-                    f"QSlider::handle:horizontal{{background:{t['accent']};width:14px;height:14px;"
-                    f"margin:-5px 0;border-radius:7px;}}"
-                    f"QSlider::sub-page:horizontal{{background:{t['accent']};border-radius:2px;}}")
-    PROG_STYLE  = (f"QProgressBar{{background:{t['surface']};border-radius:4px;text-align:center;"
-                   f"color:{t['text']};font-size:{_fs(11)}px;}}"
-                   f"QProgressBar::chunk{{background:qlineargradient(x1:0,y1:0,x2:1,y2:0,"
-                   f"stop:0 {t['accent']},stop:1 {t['accent2']});border-radius:4px;}}")
+    key = (is_light, _UI_SCALE, frozenset(t.items()))
+    cached = _STYLE_CACHE.get(key)
+    if cached is not None:
+        (APP_STYLE, GROUP_STYLE,
+         BTN_SEC, BTN_PRIMARY, BTN_PLAY, BTN_STOP, BTN_DANGER,
+         COMBO_STYLE, SLIDER_STYLE, PROG_STYLE,
+         ICON_BTN_STYLE, PREVIEW_STYLE, DROP_IDLE, DROP_HOVER) = cached
+        return
+
+    m = {
+        **t,
+        "fs10": _fs(10), "fs11": _fs(11), "fs12": _fs(12), "fs15": _fs(15),
+        "fs16": _fs(16),
+        # Light: group titles use subtext (softer), dark: keep accent (blue)
+        "title_col":  t['subtext'] if is_light else t['accent'],
+        # Light theme: buttons use a thin border so they read against the
+        # near-white bg without being dark slabs. Dark theme: no border needed.
+        "btn_border": f"1px solid {t['border2']}" if is_light else "none",
+        "checked_fg": "#ffffff" if is_light else t['bg'],
+    }
+    GROUP_STYLE  = _GROUP_STYLE_TMPL.format_map(m)
+    BTN_SEC      = _BTN_SEC_TMPL.format_map(m)
+    BTN_PRIMARY  = (_BTN_PRIMARY_LIGHT_TMPL if is_light else _BTN_PRIMARY_DARK_TMPL).format_map(m)
+    BTN_PLAY     = _BTN_PLAY_TMPL.format_map(m)
+    BTN_STOP     = _BTN_STOP_TMPL.format_map(m)
+    BTN_DANGER   = _BTN_DANGER_TMPL.format_map(m)
+    COMBO_STYLE  = _COMBO_STYLE_TMPL.format_map(m)
+    SLIDER_STYLE = _SLIDER_STYLE_TMPL.format_map(m)
+    PROG_STYLE   = _PROG_STYLE_TMPL.format_map(m)
+    ICON_BTN_STYLE = _ICON_BTN_TMPL.format_map(m)
+    PREVIEW_STYLE  = _PREVIEW_TMPL.format_map(m)
+    DROP_IDLE      = _DROP_IDLE_TMPL.format_map(m)
+    DROP_HOVER     = _DROP_HOVER_TMPL.format_map(m)
+    # The window sheet also carries the group/combo/slider rules and every
+    # button variant, so those widgets restyle with the one
+    # setStyleSheet(APP_STYLE) call instead of parsing a sheet each
+    APP_STYLE    = (_APP_STYLE_TMPL.format_map(m)
+                    + GROUP_STYLE + COMBO_STYLE + SLIDER_STYLE
+                    + "".join(ss.replace("QPushButton", f'QPushButton[variant="{v}"]')
+                              for v, ss in (("secondary", BTN_SEC),
+                                            ("primary",   BTN_PRIMARY),
+                                            ("play",      BTN_PLAY),
+                                            ("stop",      BTN_STOP),
+                                            ("danger",    BTN_DANGER),
+                                            ("icon",      ICON_BTN_STYLE))))
+
+    _STYLE_CACHE[key] = (APP_STYLE, GROUP_STYLE,
+                         BTN_SEC, BTN_PRIMARY, BTN_PLAY, BTN_STOP, BTN_DANGER,
+                         COMBO_STYLE, SLIDER_STYLE, PROG_STYLE,
+                         ICON_BTN_STYLE, PREVIEW_STYLE, DROP_IDLE, DROP_HOVER)
 
 # Initialise with dark theme
-APP_STYLE = GROUP_STYLE = PATH_EMPTY = PATH_FILLED = ""
+APP_STYLE = GROUP_STYLE = ""
 BTN_SEC = BTN_PRIMARY = BTN_PLAY = BTN_STOP = BTN_DANGER = ""
+ICON_BTN_STYLE = PREVIEW_STYLE = DROP_IDLE = DROP_HOVER = ""
 COMBO_STYLE = SLIDER_STYLE = PROG_STYLE = ""
 _build_styles()
 
 
+def _set_ui_scale(v: float):
+    """Change the UI scale — drops cached _fs() sizes and rebuilds the stylesheets."""
+    global _UI_SCALE
+    _UI_SCALE = v
+    _fs.cache_clear()
+    _build_styles()
+
+
 # ─── Icon helpers ─────────────────────────────────────────────────────────────
 
 def _icons_dir():
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+    return _ICONS_DIR
 
 def _icon(name: str, size: int = 22, color: str = None) -> QIcon:
     """Load an icon tinted to the active theme's icon colour (or an explicit hex colour)."""
-    import numpy as np
-    path = os.path.join(_icons_dir(), name)
-    if not os.path.exists(path):
+    return _tinted_icon(name, size, color or _T()["icon"])
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_source(name: str) -> Optional[QPixmap]:
+    """Decode an icon PNG from disk once; None if it is missing."""
+    pix = QPixmap(os.path.join(_ICONS_DIR, name))   # null if missing/unreadable
+    return None if pix.isNull() else pix
+
+
+@functools.lru_cache(maxsize=256)
+def _tinted_icon(name: str, size: int, color: str) -> QIcon:
+    """Build (once per name/size/colour) the tinted QIcon behind _icon().
+
+    Keyed on the colour string itself, so a cache hit costs no QColor parse
+    and a theme change simply misses into new entries — nothing needs
+    invalidating.  Callers never mutate the QIcon.
+    """
+    src = _icon_source(name)
+    if src is None:
         return QIcon()
-    col = QColor(color if color else _T()["icon"])
-    cr, cg, cb = col.red(), col.green(), col.blue()
-    # Load via PIL for fast numpy recolouring — much faster than per-pixel QImage loop
-    try:
-        from PIL import Image as _PILImg
-        img = _PILImg.open(path).convert("RGBA")
-        arr = np.array(img, dtype=np.uint8)
-        # Replace RGB channels with target colour, preserve alpha
-        arr[:, :, 0] = cr
-        arr[:, :, 1] = cg
-        arr[:, :, 2] = cb
-        h, w = arr.shape[:2]
-        qimg = QImage(arr.tobytes(), w, h, w * 4, QImage.Format.Format_RGBA8888)
-        pix = QPixmap.fromImage(qimg)
-    except Exception:
-        # Fallback: plain load without tinting
-        pix = QPixmap(path)
+    # Tint in one Qt blit: paint the colour through the icon's own alpha
+    pix = QPixmap(src.size())
+    pix.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pix)
+    p.drawPixmap(0, 0, src)
+    p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    p.fillRect(pix.rect(), QColor(color))
+    p.end()
     pix = pix.scaled(size, size,
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation)
     return QIcon(pix)
 
 
+@functools.lru_cache(maxsize=64)
+def _tinted_pixmap(name: str, size: int, color: str) -> QPixmap:
+    """The size×size pixmap of a tinted icon, for QLabel icons (see FileRow)."""
+    return _tinted_icon(name, size, color).pixmap(size, size)
+
+
 # ─── Workers ──────────────────────────────────────────────────────────────────
 
 class ProcessWorker(QThread):
@@ -273,39 +451,133 @@ class ProcessWorker(QThread):
     def __init__(self, cfg):
         super().__init__()
         self.cfg = cfg
-        self._stop = False
+        self._cancel = threading.Event()
+        self._last_p, self._last_t = -1, 0.0
 
     def run(self):
         try:
-            result = process_video(self.cfg, lambda p, m: self.progress.emit(p, m))
+            result = process_video(self.cfg, self._report, self._cancel)
             # result is True (no warning) or a warning string
             warning = result if isinstance(result, str) else ""
             self.finished.emit(True, warning)
+        except RenderCancelled:
+            pass   # stop() already reset the UI
         except Exception as e:
             self.finished.emit(False, str(e))
 
+    def _report(self, p, m):
+        # Coalesce only the per-frame "Frame i/n" updates: a new percent always
+        # goes out, otherwise at most every 50 ms. Warnings and status lines
+        # share percents with their neighbours, so they are never dropped.
+        now = time.monotonic()
+        if (m.startswith("Frame ") and p == self._last_p
+                and now - self._last_t < 0.05):
+            return
+        self._last_p, self._last_t = p, now
+        if not self._cancel.is_set():
+            self.progress.emit(p, m)
+
     def stop(self):
-        self._stop = True
-        self.terminate()
+        """Ask process_video to kill ffmpeg and return; the thread exits on its own."""
+        self._cancel.set()
 
 
-class VideoInfoWorker(QThread):
-    result = pyqtSignal(dict)
-    def __init__(self, path): super().__init__(); self.path = path
-    def run(self): self.result.emit(get_video_info(self.path))
+class VideoInfoTask(QRunnable):
+    """One-shot ffprobe on the global thread pool; emits the result through `signal`."""
+    def __init__(self, path, signal): super().__init__(); self.path = path; self.signal = signal
+    def run(self): self.signal.emit(get_video_info(self.path))
+
+
+class OsdParseTask(QRunnable):
+    """One-shot parse_osd on the global thread pool; emits (path, OsdFile or the error)."""
+    def __init__(self, path, signal): super().__init__(); self.path = path; self.signal = signal
+    def run(self):
+        try:
+            result = parse_osd(self.path)
+        except Exception as e:
+            result = e
+        self.signal.emit(self.path, result)
+
+
+class FrameExtractor(QThread):
+    """Persistent scrub-frame decoder — one thread for the whole session.
+
+    request() replaces any pending job and kills the in-flight ffmpeg, so a
+    fast scrub only ever decodes the latest position.
+    """
+    extracted = pyqtSignal(int, object)   # (pct, PIL RGBA image)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._job  = None   # (ffmpeg, path, t, pct) waiting to run
+        self._proc = None   # ffmpeg currently decoding
+
+    def _kill(self):
+        if self._proc is not None and self._proc.poll() is None:
+            try: self._proc.kill()
+            except Exception: pass
+
+    def request(self, ffmpeg, path, t, pct):
+        with self._cond:
+            self._job = (ffmpeg, path, t, pct)
+            self._kill()
+            self._cond.notify()
+
+    def stop(self):
+        self.requestInterruption()
+        with self._cond:
+            self._job = None
+            self._kill()
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._job is None and not self.isInterruptionRequested():
+                    self._cond.wait()
+                if self.isInterruptionRequested():
+                    return
+                (ffmpeg, path, t, pct), self._job = self._job, None
+            proc = None
+            try:
+                # Uncompressed PPM straight off stdout: no PNG encode/decode and
+                # no temp file, and its header carries the size (which may not
+                # be probed yet when the first frame is requested)
+                proc = _hidden_popen(
+                    [ffmpeg, "-ss", str(t), "-i", path,
+                     "-frames:v", "1", "-f", "image2pipe", "-c:v", "ppm", "pipe:1"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+                )
+                with self._cond:
+                    self._proc = proc
+                    if self._job is not None:   # superseded before it started
+                        self._kill()
+                data, _ = proc.communicate(timeout=20)
+                if proc.returncode == 0 and data and PIL_OK:
+                    self.extracted.emit(pct, PILImage.open(io.BytesIO(data)).convert("RGBA"))
+            except Exception:
+                if proc is not None and proc.poll() is None:
+                    try: proc.kill()
+                    except Exception: pass
+            finally:
+                with self._cond:
+                    self._proc = None
 
 
 # ─── Widgets ──────────────────────────────────────────────────────────────────
 
 class FileRow(QWidget):
     def __init__(self, label, placeholder, filter_str, save_mode=False, icon=None,
-                 icon_name="", parent=None):
+                 icon_name="", on_click=None, parent=None):
         super().__init__(parent)
         self.filter_str = filter_str
         self.save_mode  = save_mode
         self._path      = ""
         self._icon_name = icon_name   # stored for theme retinting
         self._icon_lbl: Optional[QLabel] = None
+        self._last_tint = None        # (icon name, colour) currently shown
 
         lay = QHBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
@@ -322,16 +594,15 @@ class FileRow(QWidget):
             lbl_row.addWidget(icon_lbl)
             self._icon_lbl = icon_lbl
         lbl = QLabel(label)
-        lbl.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-        lbl.setStyleSheet(f"color:{_T()['subtext']}")
-        self._name_lbl = lbl   # stored for theme reapply
+        lbl.setFont(_ui_font(9, bold=True))
+        lbl.setObjectName("rowName")
         lbl_row.addWidget(lbl)
         lbl_container = QWidget()
         lbl_container.setFixedWidth(72)
         lbl_container.setLayout(lbl_row)
 
         self.path_lbl = QLabel(placeholder)
-        self.path_lbl.setStyleSheet(PATH_EMPTY)
+        self.path_lbl.setProperty("role", "path")
         self.path_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.path_lbl.setFixedHeight(28)
         self.path_lbl.setMinimumWidth(60)
@@ -339,12 +610,12 @@ class FileRow(QWidget):
 
         self.btn = QPushButton("Save As" if save_mode else "Browse")
         self.btn.setFixedSize(68, 28)
-        self.btn.setStyleSheet(BTN_SEC)
-        self.btn.clicked.connect(self._browse)
+        self.btn.setProperty("variant", "secondary")
+        self.btn.clicked.connect(on_click or self._browse)
 
         self.clr = QPushButton("✕")
         self.clr.setFixedSize(28, 28)
-        self.clr.setStyleSheet(BTN_DANGER)
+        self.clr.setProperty("variant", "danger")
         self.clr.clicked.connect(lambda: self.set_path(""))
         self.clr.setVisible(False)
 
@@ -368,19 +639,25 @@ class FileRow(QWidget):
         if path:
             name = os.path.basename(path)
             self.path_lbl.setText(name)
-            self.path_lbl.setStyleSheet(PATH_FILLED)
+            _set_role(self.path_lbl, "pathSet")
             self.path_lbl.setToolTip(path)
             self.clr.setVisible(True)
         else:
             self.path_lbl.setText("No file selected")
-            self.path_lbl.setStyleSheet(PATH_EMPTY)
+            _set_role(self.path_lbl, "path")
             self.path_lbl.setToolTip("")
             self.clr.setVisible(False)
 
     def retint(self):
         """Re-tint the row icon to the current theme's icon colour."""
-        if self._icon_lbl and self._icon_name:
-            self._icon_lbl.setPixmap(_icon(self._icon_name, 16).pixmap(16, 16))
+        if not (self._icon_lbl and self._icon_name):
+            return
+        cur = (self._icon_name, _T()["icon"])
+        if cur == self._last_tint:
+            return
+        # Rows share icon names, so the pixmap is rendered once per colour
+        self._icon_lbl.setPixmap(_tinted_pixmap(self._icon_name, 16, cur[1]))
+        self._last_tint = cur
 
     @property
     def path(self):
@@ -398,23 +675,14 @@ class DropZone(QFrame):
         lay.setContentsMargins(8, 8, 8, 8)
         self._lbl = QLabel("Drop  .mp4 · .osd · .srt  here")
         self._lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._lbl.setStyleSheet(f"color:{_T()['muted']};font-size:11px;")
         lay.addWidget(self._lbl)
         self._update_idle()
 
     def _update_idle(self):
-        self.setStyleSheet(
-            f"DropZone{{background:{_T()['bg2']};border:2px dashed {_T()['border2']};"
-            f"border-radius:8px;}}"
-        )
-        self._lbl.setStyleSheet(f"color:{_T()['muted']};font-size:11px;")
+        _set_sheet(self, DROP_IDLE)
 
     def _update_hover(self):
-        self.setStyleSheet(
-            f"DropZone{{background:{_T()['surface']};border:2px solid {_T()['accent']};"
-            f"border-radius:8px;}}"
-        )
-        self._lbl.setStyleSheet(f"color:{_T()['accent']};font-size:11px;font-weight:bold;")
+        _set_sheet(self, DROP_HOVER)
 
     def refresh_theme(self):
         self._update_idle()
@@ -455,17 +723,16 @@ class LabeledSlider(QWidget):
 
         self._lbl = QLabel(label)
         self._lbl.setFixedWidth(58)
-        self._lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        self._lbl.setObjectName("sliderLabel")
 
         self.sl = QSlider(Qt.Orientation.Horizontal)
         self.sl.setRange(lo, hi)
         self.sl.setValue(val)
-        self.sl.setStyleSheet(SLIDER_STYLE)
 
         self.vl = QLabel(f"{val}{suffix}")
         self.vl.setFixedWidth(56)
         self.vl.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.vl.setStyleSheet(f"color:{_T()['text']};font-size:11px;font-weight:bold;")
+        self.vl.setObjectName("sliderValue")
 
         self.sl.valueChanged.connect(
             lambda v: (self.vl.setText(f"{v}{self._s}"), self.valueChanged.emit(v))
@@ -477,15 +744,10 @@ class LabeledSlider(QWidget):
     def value(self): return self.sl.value()
     def setValue(self, v): self.sl.setValue(v)
 
-    def refresh_theme(self):
-        self._lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
-        self.vl.setStyleSheet(f"color:{_T()['text']};font-size:11px;font-weight:bold;")
-
 
 class InfoCard(QGroupBox):
     def __init__(self, title, parent=None):
         super().__init__(title, parent)
-        self.setStyleSheet(GROUP_STYLE)
         self._g = QGridLayout(self)
         self._g.setColumnStretch(1, 1)
         self._g.setSpacing(2)
@@ -494,9 +756,9 @@ class InfoCard(QGroupBox):
 
     def add_row(self, k, v):
         kl = QLabel(k + ":")
-        kl.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        kl.setObjectName("infoKey")
         vl = QLabel(str(v))
-        vl.setStyleSheet(f"color:{_T()['text']};font-size:10px;font-weight:600;")
+        vl.setObjectName("infoValue")
         self._g.addWidget(kl, self._r, 0)
         self._g.addWidget(vl, self._r, 1)
         self._r += 1
@@ -508,14 +770,14 @@ class InfoCard(QGroupBox):
                 it.widget().deleteLater()
         self._r = 0
 
-    def refresh_theme(self):
-        for row in range(self._r):
-            ki = self._g.itemAtPosition(row, 0)
-            vi = self._g.itemAtPosition(row, 1)
-            if ki and ki.widget():
-                ki.widget().setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
-            if vi and vi.widget():
-                vi.widget().setStyleSheet(f"color:{_T()['text']};font-size:10px;font-weight:600;")
+
+def _fill_gradient(t):
+    """Accent → accent2 fill; ObjectBoundingMode stretches it over whatever is drawn."""
+    g = QLinearGradient(0, 0, 1, 0)
+    g.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    g.setColorAt(0.0, QColor(t['accent']))
+    g.setColorAt(1.0, QColor(t['accent2']))
+    return g
 
 
 class RenderBar(QWidget):
@@ -528,6 +790,17 @@ class RenderBar(QWidget):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self._value    = 0      # 0-100
         self._active   = False  # True only while rendering
+        self._font     = _ui_font(9)
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        """Cache the theme colours used by paintEvent (called on theme change)."""
+        t = _T()
+        self._c_bg      = QColor(t['surface'])
+        self._fill      = _fill_gradient(t)
+        self._c_text    = QColor(t['text'])
+        self._c_muted   = QColor(t['muted'])
+        self.update()
 
     def setValue(self, v: int):
         self._value = max(0, min(100, v))
@@ -544,7 +817,6 @@ class RenderBar(QWidget):
         return self._value
 
     def paintEvent(self, _e):
-        t  = _T()
         w, h = self.width(), self.height()
         p  = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -552,22 +824,18 @@ class RenderBar(QWidget):
 
         # Background — surface colour (very subtle in light, dark slab in dark)
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(t['surface']))
+        p.setBrush(self._c_bg)
         p.drawRoundedRect(0, 0, w, h, r, r)
 
         # Fill — only when an active render is in progress
         if self._active and self._value > 0:
             fw = int(w * self._value / 100)
-            from PyQt6.QtGui import QLinearGradient
-            grad = QLinearGradient(0, 0, fw, 0)
-            grad.setColorAt(0.0, QColor(t['accent']))
-            grad.setColorAt(1.0, QColor(t['accent2']))
-            p.setBrush(grad)
+            p.setBrush(self._fill)
             p.drawRoundedRect(0, 0, fw, h, r, r)
 
         # Text
-        p.setPen(QColor(t['text'] if self._active else t['muted']))
-        p.setFont(QFont("Segoe UI", 9))
+        p.setPen(self._c_text if self._active else self._c_muted)
+        p.setFont(self._font)
         if self._active and self._value > 0:
             label = f"{self._value}%"
         elif self._active:
@@ -589,6 +857,16 @@ class CacheBar(QWidget):
         self._cached  = 0   # frames cached so far
         self._visible = False
         self.setVisible(False)
+        self._font    = _ui_font(8)
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        """Cache the theme colours used by paintEvent (called on theme change)."""
+        t = _T()
+        self._c_bg      = QColor(t['surface'])
+        self._fill      = _fill_gradient(t)
+        self._c_text    = QColor(t['text'])
+        self.update()
 
     def start(self, total: int):
         self._total   = max(1, total)
@@ -608,28 +886,23 @@ class CacheBar(QWidget):
         self.setVisible(False)
 
     def paintEvent(self, _e):
-        t = _T()
         w, h = self.width(), self.height()
         p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # No antialiasing: an 18 px flat bar with r=3 corners gains nothing from it
         r = 3
         # Background track
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(t['surface']))
+        p.setBrush(self._c_bg)
         p.drawRoundedRect(0, 0, w, h, r, r)
         # Fill
         if self._total > 0:
             fw = int(w * min(self._cached, self._total) / self._total)
             if fw > 0:
-                from PyQt6.QtGui import QLinearGradient
-                grad = QLinearGradient(0, 0, fw, 0)
-                grad.setColorAt(0.0, QColor(t['accent']))
-                grad.setColorAt(1.0, QColor(t['accent2']))
-                p.setBrush(grad)
+                p.setBrush(self._fill)
                 p.drawRoundedRect(0, 0, fw, h, r, r)
         # Label
-        p.setPen(QColor(t['text']))
-        p.setFont(QFont("Segoe UI", 8))
+        p.setPen(self._c_text)
+        p.setFont(self._font)
         label = f"Caching preview…  {self._cached}/{self._total}"
         p.drawText(0, 0, w, h, Qt.AlignmentFlag.AlignCenter, label)
         p.end()
@@ -650,6 +923,17 @@ class RangeSelector(QWidget):
         self._out = 1.0
         self._drag = None   # "in" | "out" | None
         self.setMouseTracking(True)
+        self._font = _ui_font(6, bold=True)
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        """Cache the theme colours used by paintEvent (called on theme change)."""
+        t = _T()
+        self._c_track  = QColor(t['surface'])
+        self._c_accent = QColor(t['accent'])
+        self._c_handle = QColor(t['text'])
+        self._c_label  = QColor(t['bg'])
+        self.update()
 
     # ── public api ────────────────────────────────────────────────────────────
     @property
@@ -693,27 +977,28 @@ class RangeSelector(QWidget):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         tx, ty, tw, th = self._track_rect()
-        t = _T()
 
         # Full track
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(t['surface']))
+        p.setBrush(self._c_track)
         p.drawRoundedRect(tx, ty, tw, th, 3, 3)
 
-        # Active region
+        # Active region — a plain rect, drawn without antialiasing
         x1 = self._handle_x(self._in)
         x2 = self._handle_x(self._out)
-        p.setBrush(QColor(t['accent']))
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        p.setBrush(self._c_accent)
         p.drawRect(x1, ty, x2 - x1, th)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Handles
         hw = self.HANDLE_W
+        p.setFont(self._font)
         for pct, label in ((self._in, "I"), (self._out, "O")):
             hx, hy, hwidth, hheight = self._handle_rect(pct)
-            p.setBrush(QColor(t['text']))
+            p.setBrush(self._c_handle)
             p.drawRoundedRect(hx, hy, hwidth, hheight, 3, 3)
-            p.setPen(QColor(t['bg']))
-            p.setFont(QFont("Segoe UI", 6, QFont.Weight.Bold))
+            p.setPen(self._c_label)
             p.drawText(hx, hy, hwidth, hheight,
                        Qt.AlignmentFlag.AlignCenter, label)
             p.setPen(Qt.PenStyle.NoPen)
@@ -757,20 +1042,32 @@ class PreviewPanel(QLabel):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setScaledContents(False)
-        t = _T()
-        self.setStyleSheet(
-            f"background:{t['bg2']};border:1px solid {t['border']};border-radius:8px;")
-        self._pil_img = None          # always keep full-res PIL source
+        self.setStyleSheet(PREVIEW_STYLE)
+        self._src = None              # full-res source frame (QImage)
         self._donate_rects = []       # clickable zones while placeholder is shown
+        # Coalesce resize bursts (splitter / window drags) into one re-scale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self._on_resized)
+        # Draft (fast) scaling while scrubbing/playing, smooth once idle
+        self._hi_quality   = True
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(200)
+        self._refine_timer.timeout.connect(self._refine)
+        self._placeholder_key = None   # (size, colours) of _placeholder_pix
+        self._placeholder_pix = None
+        self._placeholder_rects = []
         self._placeholder()
 
     def _placeholder(self):
-        self._pil_img = None
+        self._src = None
         self.setMouseTracking(True)
         self._redraw_placeholder()
 
     def mouseMoveEvent(self, event):
-        if self._pil_img is None:
+        if self._src is None:
             pos = event.position().toPoint()
             in_zone = any(r.contains(pos) for r in self._donate_rects)
             self.setCursor(Qt.CursorShape.PointingHandCursor if in_zone
@@ -778,7 +1075,7 @@ class PreviewPanel(QLabel):
         super().mouseMoveEvent(event)
 
     def mousePressEvent(self, event):
-        if self._pil_img is None:
+        if self._src is None:
             pos = event.position().toPoint()
             if any(r.contains(pos) for r in self._donate_rects):
                 QDesktopServices.openUrl(QUrl(_DONATE_URL))
@@ -787,8 +1084,14 @@ class PreviewPanel(QLabel):
     def _redraw_placeholder(self):
         w = max(self.width(), 1)
         h = max(self.height(), 1)
-        pix = QPixmap(w, h)
         t = _T()
+        # Same size and colours as last time → reuse the rendered pixmap
+        key = (w, h, t["bg2"], t["subtext"], t["border2"], t["muted"], t["accent"])
+        if key == self._placeholder_key:
+            self._donate_rects = self._placeholder_rects
+            super().setPixmap(self._placeholder_pix)
+            return
+        pix = QPixmap(w, h)
         pix.fill(QColor(t["bg2"]))
         p = QPainter(pix)
 
@@ -820,7 +1123,7 @@ class PreviewPanel(QLabel):
         # ── Quick Start ────────────────────────────────────────────────────
         title_y = top
         p.setPen(QPen(QColor(t["subtext"])))
-        p.setFont(QFont("Segoe UI", 13, QFont.Weight.Bold))
+        p.setFont(_ui_font(13, bold=True))
         p.drawText(QRect(lx, title_y, lw, TITLE_H),
                    Qt.AlignmentFlag.AlignCenter, "Quick Start")
 
@@ -836,7 +1139,7 @@ class PreviewPanel(QLabel):
             "④  Set the output file path, then click  Render",
         ]
         p.setPen(QPen(QColor(t["muted"])))
-        p.setFont(QFont("Segoe UI", 10))
+        p.setFont(_ui_font(10))
         for i, line in enumerate(steps):
             p.drawText(QRect(lx, step0_y + i * STEP_PITCH, lw, STEP_H),
                        Qt.AlignmentFlag.AlignLeft, line)
@@ -868,12 +1171,12 @@ class PreviewPanel(QLabel):
                         p.drawRect(heart_x + ci * px, heart_y + ri * px, px, px)
 
             p.setPen(QPen(QColor(t["muted"])))
-            p.setFont(QFont("Segoe UI", 9))
+            p.setFont(_ui_font(9))
             p.drawText(QRect(lx, heart_y + heart_h + 4, lw, 16),
                        Qt.AlignmentFlag.AlignCenter, _DONATE_NOTE)
 
             p.setPen(QPen(QColor(t["accent"])))
-            p.setFont(QFont("Segoe UI", 9))
+            p.setFont(_ui_font(9))
             p.drawText(QRect(lx, heart_y + heart_h + 24, lw, 16),
                        Qt.AlignmentFlag.AlignCenter, "buymeacoffee.com/failsavefpv  \u2197")
 
@@ -885,34 +1188,65 @@ class PreviewPanel(QLabel):
             self._donate_rects = []
 
         p.end()
+        self._placeholder_key   = key
+        self._placeholder_pix   = pix
+        self._placeholder_rects = self._donate_rects
         super().setPixmap(pix)
 
     def show_frame(self, img):
+        """Show a PIL frame; returns the converted QImage (None without PIL)."""
         if not PIL_OK:
-            return
+            return None
+        # Convert once; every resize/scrub repaint then scales this QImage.
+        # Frames are decoded as RGBA already, and tobytes() copies anyway.
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        data = img.tobytes("raw", "RGBA")
+        qi = QImage(data, img.width, img.height, img.width * 4,
+                    QImage.Format.Format_RGBA8888).copy()
+        self.show_image(qi)
+        return qi
+
+    def show_image(self, qi):
+        """Show an already converted frame (e.g. from the composite cache)."""
+        if qi is self._src:
+            return   # already on screen; resize/refine timers repaint on their own
         self.setMouseTracking(False)
         self.setCursor(Qt.CursorShape.ArrowCursor)
         self._donate_rects = []
-        self._pil_img = img.convert("RGBA")
+        self._src = qi
         self._repaint()
 
     def _repaint(self):
-        """Render PIL image scaled to fit current widget, maintaining aspect ratio."""
-        if self._pil_img is None:
+        """Render the source frame scaled to fit current widget, maintaining aspect ratio."""
+        if self._src is None:
             return
         w = max(self.width(),  320)
         h = max(self.height(), 180)
-        # Scale down only (thumbnail won't upscale) — use LANCZOS for quality
-        tmp = self._pil_img.copy()
-        tmp.thumbnail((w, h), PILImage.LANCZOS)
-        data = tmp.tobytes("raw", "RGBA")
-        qi   = QImage(data, tmp.width, tmp.height, QImage.Format.Format_RGBA8888)
+        # Scale down only (never upscale past the source resolution)
+        qi = self._src
+        if qi.width() > w or qi.height() > h:
+            mode = (Qt.TransformationMode.SmoothTransformation if self._hi_quality
+                    else Qt.TransformationMode.FastTransformation)
+            qi = qi.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, mode)
         # Centre inside the widget — QLabel AlignCenter handles this automatically
         super().setPixmap(QPixmap.fromImage(qi))
 
+    def draft(self):
+        """Use fast scaling until interaction pauses, then repaint smoothly."""
+        self._hi_quality = False
+        self._refine_timer.start()
+
+    def _refine(self):
+        self._hi_quality = True
+        self._repaint()
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        if self._pil_img is not None:
+        self._resize_timer.start()
+
+    def _on_resized(self):
+        if self._src is not None:
             self._repaint()
         else:
             self._redraw_placeholder()
@@ -922,14 +1256,51 @@ def _sep():
     """Thin horizontal separator line."""
     f = QFrame()
     f.setFrameShape(QFrame.Shape.HLine)
-    f.setStyleSheet(f"color:{_T()['border']}")
+    f.setProperty("role", "divider")
     f.setFixedHeight(1)
     return f
 
 
+def _set_sheet(w, ss):
+    """setStyleSheet only if the sheet changed — Qt re-parses and re-polishes
+    the widget's whole subtree on every call, even for an identical string."""
+    if w.styleSheet() != ss:
+        w.setStyleSheet(ss)
+
+
+def _set_role(w, role):
+    """Switch a widget's QSS role (styled by APP_STYLE) and re-polish it."""
+    w.setProperty("role", role)
+    w.style().unpolish(w)
+    w.style().polish(w)
+
+
+# ── Combo box choices (label tuples + the value for each index) ──────────────
+
+_SCALE_LABELS   = ("100%", "125%", "150%", "175%")
+_SCALE_VALS     = (1.0, 1.25, 1.5, 1.75)
+_CODEC_LABELS   = ("H.264 (libx264)", "H.265 (libx265)")
+_CODECS         = ("libx264", "libx265")
+_UPSCALE_LABELS = ("Off", "1440p  (2560×1440)", "2.7K  (2688×1512)", "4K  (3840×2160)")
+_UPSCALE_TARGETS = ("", "1440p", "2.7k", "4k")   # ProcessingConfig.upscale_target
+_SPEED_LABELS   = ("Draft (fastest)", "Balanced", "Final (smallest)")
+_SPEED_MODES    = ("draft", "balanced", "final")   # ProcessingConfig.quality_mode
+
+# Output-name suffixes stripped by MainWindow._clean_stem
+_STEM_TS_RE  = re.compile(r'_osd_\d+[-_]\d+$')   # _osd_NNNN-NNNN timestamp variants
+_STEM_OSD_RE = re.compile(r'_osd$')              # bare _osd
+
+
 # ─── Main Window ──────────────────────────────────────────────────────────────
 
 class MainWindow(QMainWindow):
+    _video_info   = pyqtSignal(dict)     # emitted from VideoInfoTask on a pool thread
+    _osd_parsed   = pyqtSignal(str, object)   # emitted from OsdParseTask on a pool thread
+    _gpu_detected = pyqtSignal(object, object)   # (find_ffmpeg(), detect_hw_encoder())
+    _preview_dirty = False   # a refresh was skipped while the preview was hidden
+
+    _COMPOSITE_CACHE_BYTES = 128 * 1024 * 1024   # composited preview frames
+
     def __init__(self):
         super().__init__()
         self.srt_data:   Optional[SrtFile] = None
@@ -938,21 +1309,42 @@ class MainWindow(QMainWindow):
         self.video_frame = None
         self.video_fps:  float = 60.0
         self.video_dur:  float = 0.0
+        self._video_dur_ms: int = 0        # video_dur in whole ms, for _video_time_ms
+        self.video_size: tuple = (0, 0)   # (width, height) from ffprobe
+        self._ffmpeg_path: Optional[str] = None   # see _ffmpeg()
+        self._ffmpeg_resolved = False
         self.cached_frames: dict = {}
+        self._cached_pcts_sorted: list = []   # keys of cached_frames, ascending
+        self._cache_lock = threading.Lock()   # prefetch workers write concurrently
+        self._composite_cache: dict = {}   # see _show_composite; oldest evicted first
+        self._composite_bytes = 0
+        self._last_composite = None        # (img, osd_frame, font, cfg, qi) last shown
         self.worker      = None
         self._font_db:   dict = {}
         self.source_mbps: float = 0.0   # source video bitrate, set after loading
-        self._extract_proc = None        # current ffmpeg frame-extract process
+        self._extractor: Optional[FrameExtractor] = None   # started on first scrub
         self._prefetch_stop = False      # signal to stop background prefetch
+        self._video_info.connect(self._got_vid_info)
+        self._osd_parsed.connect(self._got_osd)
+        self._osd_loading = None         # path of the OSD file being parsed, if any
         self._scrub_timer  = QTimer()    # debounce frame-slider scrubbing
         self._scrub_timer.setSingleShot(True)
         self._scrub_timer.setInterval(80)
         self._scrub_timer.timeout.connect(self._do_scrub)
         self._pending_pct  = 0
-        self._preview_timer = QTimer()   # debounce position/scale/opacity sliders
+        self._frame_timer  = QTimer()    # throttle frame-slider updates to ~60 Hz
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(16)
+        self._frame_timer.timeout.connect(lambda: self._on_frame_sl(self.frame_sl.value()))
+        self._preview_timer = QTimer()   # debounce position/scale/opacity/trim drags
         self._preview_timer.setSingleShot(True)
-        self._preview_timer.setInterval(60)
+        self._preview_timer.setInterval(33)   # ≈30 Hz ceiling while dragging
         self._preview_timer.timeout.connect(self._refresh_preview)
+        self._size_hint_timer = QTimer()   # coalesce trim / bitrate drags
+        self._size_hint_timer.setSingleShot(True)
+        self._size_hint_timer.setInterval(50)
+        self._size_hint_timer.timeout.connect(self._update_size_hint)
+        self._size_hint_key = None         # inputs behind the current size_hint text
         # Playback state
         self._play_timer   = QTimer()
         self._play_timer.setInterval(100)   # tick every 100ms → ~10fps preview steps
@@ -961,7 +1353,7 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle(f"VueOSD v{VERSION} — Digital FPV OSD Tool")
         # App icon — resolved relative to this script so it works from any CWD
-        _icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icon.png")
+        _icon_path = os.path.join(_ASSETS_DIR, "icon.png")
         if os.path.exists(_icon_path):
             self.setWindowIcon(QIcon(_icon_path))
         self.setMinimumSize(1100, 700)
@@ -979,16 +1371,16 @@ class MainWindow(QMainWindow):
         left_scroll = QScrollArea()
         left_scroll.setWidgetResizable(True)
         left_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        left_scroll.setStyleSheet(
-            "QScrollArea{border:none;background:transparent;}"
-            "QScrollBar:vertical{background:#1e1e2e;width:6px;border-radius:3px;}"
-            "QScrollBar::handle:vertical{background:#45475a;border-radius:3px;}"
-        )
+        left_scroll.setObjectName("leftScroll")
         left_scroll.setMinimumWidth(300)
         left_scroll.setMaximumWidth(400)
+        left_scroll.verticalScrollBar().setSingleStep(12)   # finer wheel steps
 
         left_inner = QWidget()
         left_inner.setMinimumWidth(280)
+        # Opaque (palette bg from APP_STYLE) so scrolling blits the already
+        # painted content and repaints only the newly exposed strip
+        left_inner.setAutoFillBackground(True)
         ll = QVBoxLayout(left_inner)
         ll.setContentsMargins(14, 16, 10, 16)
         ll.setSpacing(10)
@@ -999,43 +1391,38 @@ class MainWindow(QMainWindow):
         hdr_row.setSpacing(8)
 
         h1 = QLabel("VueOSD")
-        h1.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        h1.setStyleSheet(f"color:{_T()['text']};")
+        h1.setFont(_ui_font(16, bold=True))
+        h1.setProperty("role", "title")
         self._h1 = h1
 
         h2 = QLabel("Digital FPV OSD Tool")
-        h2.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        h2.setStyleSheet(f"color:{_T()['text']};")
+        h2.setFont(_ui_font(16, bold=True))
+        h2.setProperty("role", "title")
         h2.setAlignment(Qt.AlignmentFlag.AlignBottom)
         self._h2 = h2
 
         ver = QLabel(f"v{VERSION}")
-        ver.setFont(QFont("Segoe UI", _fs(8)))
-        ver.setStyleSheet(f"color:{_T()['muted']};")
+        ver.setFont(_ui_font(_fs(8)))
+        ver.setProperty("role", "version")
         ver.setAlignment(Qt.AlignmentFlag.AlignBottom)
         self._ver_lbl = ver
 
         self._theme_btn = QPushButton()
         self._theme_btn.setFixedSize(30, 30)
         self._theme_btn.setToolTip("Toggle light / dark theme")
-        self._theme_btn.setStyleSheet(
-            f"QPushButton{{background:transparent;border:none;border-radius:15px;}}"
-            f"QPushButton:hover{{background:{_T()['surface']};}}"
-        )
+        self._theme_btn.setProperty("variant", "icon")
         self._theme_btn.setIcon(_icon("moon-dark.png", 18))
         self._theme_btn.clicked.connect(self._toggle_theme)
 
         self._palette_btn = QPushButton()
         self._palette_btn.setFixedSize(30, 30)
         self._palette_btn.setToolTip("Open theme colour editor")
-        self._palette_btn.setStyleSheet(
-            f"QPushButton{{background:transparent;border:none;border-radius:15px;}}"
-            f"QPushButton:hover{{background:{_T()['surface']};}}"
-        )
+        self._palette_btn.setProperty("variant", "icon")
         self._palette_btn.setText("🎨")
-        self._palette_btn.setFont(QFont("Segoe UI", 14))
+        self._palette_btn.setFont(_ui_font(14))
         self._palette_btn.clicked.connect(self._open_theme_editor)
         self._theme_editor_dlg = None   # lazily created
+        self._theme_hashes = {}         # _apply_theme group → last palette subhash
 
         hdr_row.addWidget(h1)
         hdr_row.addWidget(h2)
@@ -1050,15 +1437,14 @@ class MainWindow(QMainWindow):
         scale_row.setContentsMargins(0, 2, 0, 0)
         scale_row.setSpacing(6)
         scale_lbl = QLabel("UI Scale")
-        scale_lbl.setStyleSheet(f"color:{_T()['muted']};font-size:{_fs(10)}px;")
+        scale_lbl.setProperty("role", "hint")
         self._scale_lbl = scale_lbl
         self._scale_cb = QComboBox()
-        self._scale_cb.addItems(["100%", "125%", "150%", "175%"])
-        _scale_vals = [1.0, 1.25, 1.5, 1.75]
-        _scale_idx = min(range(len(_scale_vals)), key=lambda i: abs(_scale_vals[i] - _UI_SCALE))
+        self._scale_cb.addItems(_SCALE_LABELS)
+        # _SCALE_VALS step by 0.25 from 1.0, so the nearest entry is arithmetic
+        _scale_idx = max(0, min(len(_SCALE_VALS) - 1, round((_UI_SCALE - 1.0) / 0.25)))
         self._scale_cb.setCurrentIndex(_scale_idx)
         self._scale_cb.setFixedWidth(72)
-        self._scale_cb.setStyleSheet(COMBO_STYLE)
         self._scale_cb.currentIndexChanged.connect(self._on_scale_changed)
         scale_row.addWidget(scale_lbl)
         scale_row.addWidget(self._scale_cb)
@@ -1067,7 +1453,6 @@ class MainWindow(QMainWindow):
 
         # ── Files group ───────────────────────────────────────────────────────
         fg = QGroupBox("Files")
-        fg.setStyleSheet(GROUP_STYLE)
         fgl = QVBoxLayout(fg)
         fgl.setSpacing(4)
         fgl.setContentsMargins(10, 16, 10, 10)
@@ -1077,17 +1462,15 @@ class MainWindow(QMainWindow):
         fgl.addWidget(self.drop_zone)
 
         self.video_row = FileRow("Video",  "Select video…",  "Video (*.mp4 *.mkv *.avi *.mov)",
-                                 icon=_icon("video.png", 16), icon_name="video.png")
+                                 icon=_icon("video.png", 16), icon_name="video.png",
+                                 on_click=self._on_video)
         self.osd_row   = FileRow("OSD",    "Auto-detected",  "OSD (*.osd)",
-                                 icon=_icon("gear.png",  16), icon_name="gear.png")
+                                 icon=_icon("gear.png",  16), icon_name="gear.png",
+                                 on_click=self._manual_osd)
         self.srt_row   = FileRow("SRT",    "Auto-detected",  "SRT (*.srt)",
-                                 icon=_icon("wifi.png",  16), icon_name="wifi.png")
-        self.video_row.btn.clicked.disconnect()
-        self.video_row.btn.clicked.connect(self._on_video)
-        self.osd_row.btn.clicked.disconnect()
-        self.osd_row.btn.clicked.connect(self._manual_osd)
-        self.srt_row.btn.clicked.disconnect()
-        self.srt_row.btn.clicked.connect(self._manual_srt)
+                                 icon=_icon("wifi.png",  16), icon_name="wifi.png",
+                                 on_click=self._manual_srt)
+        self._file_rows = (self.video_row, self.osd_row, self.srt_row)   # + out_row later
 
         fgl.addWidget(self.video_row)
         fgl.addWidget(self.osd_row)
@@ -1096,7 +1479,6 @@ class MainWindow(QMainWindow):
 
         # ── OSD Font group ────────────────────────────────────────────────────
         fontg = QGroupBox("OSD Font")
-        fontg.setStyleSheet(GROUP_STYLE)
         fontgl = QVBoxLayout(fontg)
         fontgl.setSpacing(6)
         fontgl.setContentsMargins(10, 16, 10, 10)
@@ -1106,9 +1488,8 @@ class MainWindow(QMainWindow):
         st_row = QHBoxLayout()
         self._st_lbl = QLabel("Style:")
         self._st_lbl.setFixedWidth(68)
-        self._st_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        self._st_lbl.setProperty("role", "field")
         self.style_combo = QComboBox()
-        self.style_combo.setStyleSheet(COMBO_STYLE)
         self.style_combo.currentIndexChanged.connect(self._on_style_changed)
         st_row.addWidget(self._st_lbl)
         st_row.addWidget(self.style_combo, 1)
@@ -1118,10 +1499,9 @@ class MainWindow(QMainWindow):
         hd_row = QHBoxLayout()
         self.hd_check = QCheckBox("HD tiles")
         self.hd_check.setChecked(True)
-        self.hd_check.setStyleSheet(f"color:{_T()['text']};font-size:11px;")
         self.hd_check.stateChanged.connect(self._reload_font)
         self._custom_btn = QPushButton("Custom…")
-        self._custom_btn.setStyleSheet(BTN_SEC)
+        self._custom_btn.setProperty("variant", "secondary")
         self._custom_btn.setFixedHeight(26)
         self._custom_btn.clicked.connect(self._custom_font)
         hd_row.addWidget(self.hd_check)
@@ -1130,32 +1510,30 @@ class MainWindow(QMainWindow):
         fontgl.addLayout(hd_row)
 
         self.font_lbl = QLabel("No font loaded")
-        self.font_lbl.setStyleSheet(f"color:{_T()['orange']};font-size:10px;")
+        self.font_lbl.setProperty("role", "warn")
         self.font_lbl.setWordWrap(True)
         fontgl.addWidget(self.font_lbl)
         ll.addWidget(fontg)
 
         # ── Link Status Bar ───────────────────────────────────────────────────
         srtg = QGroupBox("Link Status Bar")
-        srtg.setStyleSheet(GROUP_STYLE)
         srtgl = QVBoxLayout(srtg)
         srtgl.setSpacing(4)
         srtgl.setContentsMargins(10, 16, 10, 10)
 
         self.srt_bar_check = QCheckBox("Show link status bar")
         self.srt_bar_check.setChecked(True)
-        self.srt_bar_check.setStyleSheet(f"color:{_T()['text']};font-size:11px;")
         self.srt_bar_check.stateChanged.connect(self._refresh_preview)
 
         self.srt_opacity_sl = LabeledSlider("Opacity", 10, 100, 60, "%")
-        self.srt_opacity_sl.valueChanged.connect(self._refresh_preview)
+        self.srt_opacity_sl.valueChanged.connect(self._queue_preview)
 
         self.srt_size_sl = LabeledSlider("Size", 75, 200, 100, "%")
-        self.srt_size_sl.valueChanged.connect(self._refresh_preview)
+        self.srt_size_sl.valueChanged.connect(self._queue_preview)
 
         note2 = QLabel("Radio signal, bitrate, GPS, altitude from .srt.\n"
                        "'No MAVLink telemetry' lines are hidden.")
-        note2.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        note2.setProperty("role", "hint")
         note2.setWordWrap(True)
 
         srtgl.addWidget(self.srt_bar_check)
@@ -1166,7 +1544,6 @@ class MainWindow(QMainWindow):
 
         ll.addStretch()
         left_scroll.setWidget(left_inner)
-        self._left_scroll = left_scroll   # saved for theme reapply
 
         # ── CENTRE: preview + below-video controls ─────────────────────────────
         centre = QWidget()
@@ -1175,8 +1552,8 @@ class MainWindow(QMainWindow):
         cl.setSpacing(8)
 
         self._prev_lbl = QLabel("Preview")
-        self._prev_lbl.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self._prev_lbl.setStyleSheet(f"color:{_T()['subtext']}")
+        self._prev_lbl.setFont(_ui_font(12, bold=True))
+        self._prev_lbl.setProperty("role", "header")
         cl.addWidget(self._prev_lbl)
 
         self.preview = PreviewPanel()
@@ -1186,40 +1563,41 @@ class MainWindow(QMainWindow):
         # Frame scrub
         frow = QHBoxLayout()
         fl = QLabel("Frame:")
-        fl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        fl.setProperty("role", "field")
         fl.setFixedWidth(46)
         self.frame_sl = QSlider(Qt.Orientation.Horizontal)
         self.frame_sl.setRange(0, 100)
         self.frame_sl.setValue(0)
-        self.frame_sl.setStyleSheet(SLIDER_STYLE)
-        self.frame_sl.valueChanged.connect(self._on_frame_sl)
+        self.frame_sl.valueChanged.connect(self._queue_frame_sl)
         self.frame_lbl = QLabel("0%")
         self.frame_lbl.setFixedWidth(34)
-        self.frame_lbl.setStyleSheet(f"color:{_T()['text']};font-size:11px;font-weight:bold;")
+        self.frame_lbl.setProperty("role", "value")
         frow.addWidget(fl)
         frow.addWidget(self.frame_sl)
         frow.addWidget(self.frame_lbl)
         cl.addLayout(frow)
 
         self.frame_info = QLabel("t = 0.0s  |  OSD —")
-        self.frame_info.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        self.frame_info.setProperty("role", "hint")
         cl.addWidget(self.frame_info)
 
-        self.cache_bar = CacheBar()
-        cl.addWidget(self.cache_bar)
+        # The cache bar stays hidden until a prefetch runs, so it is only
+        # built then (see the cache_bar property); remember its layout slot
+        self._cache_bar = None
+        self._cache_bar_slot = (cl, cl.count())
 
         # ── Trim range selector ───────────────────────────────────────────────
         trim_hdr = QHBoxLayout()
         trim_lbl = QLabel("Trim")
-        trim_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        trim_lbl.setProperty("role", "field")
         trim_lbl.setFixedWidth(36)
         self.trim_in_lbl  = QLabel("In: 0:00")
         self.trim_out_lbl = QLabel("Out: —")
         for lb in (self.trim_in_lbl, self.trim_out_lbl):
-            lb.setStyleSheet(f"color:{_T()['subtext']};font-size:10px;font-weight:bold;")
+            lb.setProperty("role", "time")
         self._trim_rst_btn = QPushButton("✕")
         self._trim_rst_btn.setFixedSize(20, 20)
-        self._trim_rst_btn.setStyleSheet(BTN_SEC)
+        self._trim_rst_btn.setProperty("variant", "secondary")
         self._trim_rst_btn.setToolTip("Reset trim to full video")
         self._trim_rst_btn.clicked.connect(self._trim_reset)
         trim_hdr.addWidget(trim_lbl)
@@ -1231,7 +1609,7 @@ class MainWindow(QMainWindow):
 
         self.trim_sel = RangeSelector()
         self.trim_sel.rangeChanged.connect(self._on_trim_changed)
-        self.trim_sel.rangeChanged.connect(lambda *_: self._update_size_hint())
+        self.trim_sel.rangeChanged.connect(lambda *_: self._size_hint_timer.start())
         cl.addWidget(self.trim_sel)
 
         # ── Playback controls (icon buttons) ─────────────────────────────────
@@ -1241,21 +1619,21 @@ class MainWindow(QMainWindow):
         self.restart_btn = QPushButton()
         self.restart_btn.setIcon(_icon("rewind.png", 20))
         self.restart_btn.setFixedSize(34, 34)
-        self.restart_btn.setStyleSheet(BTN_PLAY)
+        self.restart_btn.setProperty("variant", "play")
         self.restart_btn.setToolTip("Go to start")
         self.restart_btn.clicked.connect(self._play_restart)
 
         self.play_btn = QPushButton()
         self.play_btn.setIcon(_icon("play.png", 22))
         self.play_btn.setFixedSize(44, 34)
-        self.play_btn.setStyleSheet(BTN_PLAY)
+        self.play_btn.setProperty("variant", "play")
         self.play_btn.setToolTip("Play / Pause")
         self.play_btn.clicked.connect(self._play_toggle)
 
         self._ref_btn = QPushButton("Refresh Preview")
         self._ref_btn.setFixedHeight(34)
         self._ref_btn.setMinimumWidth(120)
-        self._ref_btn.setStyleSheet(BTN_SEC)
+        self._ref_btn.setProperty("variant", "secondary")
         self._ref_btn.clicked.connect(self._refresh_preview)
 
         play_row.addWidget(self.restart_btn)
@@ -1269,7 +1647,7 @@ class MainWindow(QMainWindow):
             'Icons by <a href="https://www.flaticon.com/free-icons/wifi-connection" '
             'style="color:#2a2a3a;text-decoration:none;">Smashicons – Flaticon</a>'
         )
-        credit.setStyleSheet(f"color:{_T()['muted']};font-size:8px;")
+        credit.setProperty("role", "credit")
         credit.setOpenExternalLinks(True)
         credit.setAlignment(Qt.AlignmentFlag.AlignRight)
         cl.addWidget(credit)
@@ -1282,13 +1660,12 @@ class MainWindow(QMainWindow):
 
         # Fine-tune position
         posg = QGroupBox("Fine-tune Position & Scale")
-        posg.setStyleSheet(GROUP_STYLE)
         posgl = QVBoxLayout(posg)
         posgl.setSpacing(4)
         posgl.setContentsMargins(10, 16, 10, 10)
 
         pos_note = QLabel("OSD auto-fitted to video height, centred.")
-        pos_note.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        pos_note.setProperty("role", "hint")
         posgl.addWidget(pos_note)
 
         self.sl_x     = LabeledSlider("X offset", -400, 400,   0, " px")
@@ -1302,7 +1679,7 @@ class MainWindow(QMainWindow):
         sync_row = QHBoxLayout()
         sync_row.setSpacing(4)
         self._sync_lbl = QLabel("OSD offset:")
-        self._sync_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:{_fs(11)}px;")
+        self._sync_lbl.setProperty("role", "field")
         self._sync_lbl.setFixedWidth(72)
         self.osd_offset_sb = QSpinBox()
         self.osd_offset_sb.setRange(-10000, 10000)
@@ -1312,17 +1689,11 @@ class MainWindow(QMainWindow):
             "Shift OSD timestamps relative to video.\n"
             "+500 ms → OSD shows data 500 ms later (compensates OSD lagging behind).\n"
             "−500 ms → OSD shows data 500 ms earlier.")
-        self.osd_offset_sb.setStyleSheet(
-            f"QSpinBox{{background:{_T()['surface']};color:{_T()['text']};"
-            f"border:1px solid {_T()['border2']};border-radius:4px;padding:3px 6px;}}"
-            f"QSpinBox::up-button,QSpinBox::down-button{{width:16px;"
-            f"background:{_T()['surface2']};border-radius:2px;}}"
-        )
         self.osd_offset_sb.valueChanged.connect(self._on_osd_offset_changed)
         self._rst_offset_btn = QPushButton("↺")
         self._rst_offset_btn.setFixedWidth(28)
         self._rst_offset_btn.setFixedHeight(24)
-        self._rst_offset_btn.setStyleSheet(BTN_SEC)
+        self._rst_offset_btn.setProperty("variant", "secondary")
         self._rst_offset_btn.setToolTip("Reset OSD offset to 0")
         self._rst_offset_btn.clicked.connect(lambda: self.osd_offset_sb.setValue(0))
         sync_row.addWidget(self._sync_lbl)
@@ -1331,7 +1702,7 @@ class MainWindow(QMainWindow):
         posgl.addLayout(sync_row)
 
         self._rst_pos_btn = QPushButton("↺  Reset")
-        self._rst_pos_btn.setStyleSheet(BTN_SEC)
+        self._rst_pos_btn.setProperty("variant", "secondary")
         self._rst_pos_btn.setFixedHeight(26)
         self._rst_pos_btn.clicked.connect(self._reset_pos)
         posgl.addWidget(self._rst_pos_btn)
@@ -1361,23 +1732,48 @@ class MainWindow(QMainWindow):
         rl.setContentsMargins(10, 16, 14, 16)
         rl.setSpacing(10)
 
+        # Contents are built on the first event-loop pass (_build_right_panel)
+        # so the window can paint before the encoding widgets exist
+        self._right_layout = rl
+        QTimer.singleShot(0, self._build_right_panel)
+
+        # ── Assemble root layout ──────────────────────────────────────────────
+        root.addWidget(left_scroll)
+        root.addWidget(centre, 1)
+        root.addWidget(right)
+
+        # Vertical dividers
+        for w in (left_scroll, centre):
+            div = QFrame()
+            div.setFrameShape(QFrame.Shape.VLine)
+            div.setProperty("role", "divider")
+            div.setFixedWidth(1)
+            root.insertWidget(root.indexOf(w) + 1, div)
+
+        # Theme reapply (_apply_theme) touches only the explicitly tracked
+        # widgets; everything else restyles through APP_STYLE
+
+        QTimer.singleShot(200, lambda: self._on_fw_changed("Betaflight"))
+
+    def _build_right_panel(self):
+        """Build the Output & Encoding panel (deferred from __init__)."""
+        rl = self._right_layout
         self._out_hdr = QLabel("Output & Encoding")
-        self._out_hdr.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self._out_hdr.setStyleSheet(f"color:{_T()['subtext']}")
+        self._out_hdr.setFont(_ui_font(12, bold=True))
+        self._out_hdr.setProperty("role", "header")
         rl.addWidget(self._out_hdr)
 
         # Output file
         out_fg = QGroupBox("Output File")
-        out_fg.setStyleSheet(GROUP_STYLE)
         out_fgl = QVBoxLayout(out_fg)
         out_fgl.setContentsMargins(10, 16, 10, 10)
         self.out_row = FileRow("Output", "Choose output path…", "", save_mode=True, icon=_icon("save.png", 16), icon_name="save.png")
         out_fgl.addWidget(self.out_row)
+        self._file_rows += (self.out_row,)
         rl.addWidget(out_fg)
 
         # Encoding settings
         encg = QGroupBox("Encoding")
-        encg.setStyleSheet(GROUP_STYLE)
         encgl = QVBoxLayout(encg)
         encgl.setSpacing(7)
         encgl.setContentsMargins(10, 16, 10, 10)
@@ -1386,15 +1782,31 @@ class MainWindow(QMainWindow):
         codec_row = QHBoxLayout()
         self._codec_lbl = QLabel("Codec:")
         self._codec_lbl.setFixedWidth(52)
-        self._codec_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        self._codec_lbl.setProperty("role", "field")
         self.codec_cb = QComboBox()
-        self.codec_cb.addItems(["H.264 (libx264)", "H.265 (libx265)"])
-        self.codec_cb.setStyleSheet(COMBO_STYLE)
+        self.codec_cb.addItems(_CODEC_LABELS)
         self.codec_cb.currentIndexChanged.connect(self._on_codec_changed)
         codec_row.addWidget(self._codec_lbl)
         codec_row.addWidget(self.codec_cb, 1)
         encgl.addLayout(codec_row)
 
+        # Encoder speed — independent of the bitrate below
+        speed_row = QHBoxLayout()
+        self._speed_lbl = QLabel("Speed:")
+        self._speed_lbl.setFixedWidth(52)
+        self._speed_lbl.setProperty("role", "field")
+        self.speed_cb = QComboBox()
+        self.speed_cb.addItems(_SPEED_LABELS)
+        self.speed_cb.setCurrentIndex(_SPEED_MODES.index("balanced"))
+        self.speed_cb.setToolTip(
+            "Draft: fastest encoder preset, for quick checks of OSD placement.\n"
+            "Balanced: the usual preset.\n"
+            "Final: slower preset, better compression for the same bitrate."
+        )
+        speed_row.addWidget(self._speed_lbl)
+        speed_row.addWidget(self.speed_cb, 1)
+        encgl.addLayout(speed_row)
+
         # Output bitrate: logarithmic slider + spinbox for fine ±1 steps
         self.mbps_row = QWidget()
         mbps_lay = QHBoxLayout(self.mbps_row)
@@ -1402,7 +1814,7 @@ class MainWindow(QMainWindow):
         mbps_lay.setSpacing(6)
         self._mbps_lbl = QLabel("Mbit/s:")
         self._mbps_lbl.setFixedWidth(52)
-        self._mbps_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+        self._mbps_lbl.setProperty("role", "field")
         self.mbps_sl = QSlider(Qt.Orientation.Horizontal)
         self.mbps_sl.setRange(0, 1000)
         self.mbps_sl.setValue(self._mbps_to_slider(8))
@@ -1411,18 +1823,11 @@ class MainWindow(QMainWindow):
             "Use the arrows on the right for ±1 Mbit/s fine steps.\n"
             "Auto-set to source average bitrate on video load."
         )
-        self.mbps_sl.setStyleSheet(SLIDER_STYLE)
         self.mbps_spin = QSpinBox()
         self.mbps_spin.setRange(1, 100)
         self.mbps_spin.setValue(8)
         self.mbps_spin.setSuffix(" Mbit/s")
         self.mbps_spin.setFixedWidth(90)
-        self.mbps_spin.setStyleSheet(
-            f"QSpinBox{{background:{_T()['surface']};color:{_T()['text']};"
-            f"border:1px solid {_T()['border2']};border-radius:4px;padding:3px 6px;}}"
-            f"QSpinBox::up-button,QSpinBox::down-button{{width:16px;"
-            f"background:{_T()['surface2']};border-radius:2px;}}"
-        )
         self.mbps_sl.valueChanged.connect(self._on_mbps_sl_changed)
         self.mbps_spin.valueChanged.connect(self._on_mbps_spin_changed)
         mbps_lay.addWidget(self._mbps_lbl)
@@ -1432,66 +1837,24 @@ class MainWindow(QMainWindow):
 
         # Estimated size hint
         self.size_hint = QLabel("")
-        self.size_hint.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        self.size_hint.setProperty("role", "hint")
         encgl.addWidget(self.size_hint)
 
         # GPU row — detection runs in background so it never blocks startup
         self.hw_check = QCheckBox("⚡  GPU acceleration")
-        self.hw_check.setStyleSheet(f"color:{_T()['text']};font-size:11px;")
         self.hw_check.setEnabled(False)
         self.hw_check.setChecked(False)
         self.hw_check.stateChanged.connect(self._update_size_hint)
         self.hw_lbl = QLabel("Detecting GPU…")
-        self.hw_lbl.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        self.hw_lbl.setProperty("role", "hint")
         encgl.addWidget(self.hw_check)
         encgl.addWidget(self.hw_lbl)
 
-        # Kick off GPU detection in background.
-        # Result is written to _gpu_result[], polled by a QTimer on the main thread.
-        # QTimer.singleShot() from a non-main thread is unreliable on Windows —
-        # using a poll timer avoids that entirely.
-        _gpu_result = [None]   # None=pending, False=done-no-gpu, dict=done-found
-        _gpu_done   = [False]
-
-        def _detect_gpu():
-            try:
-                _ffp = find_ffmpeg()
-                _hw  = detect_hw_encoder(_ffp) if _ffp else None
-            except Exception:
-                _hw = None
-            _gpu_result[0] = _hw if _hw else False
-            _gpu_done[0]   = True
-
-        threading.Thread(target=_detect_gpu, daemon=True).start()
-
-        def _poll_gpu():
-            if not _gpu_done[0]:
-                return   # still running — poll again next tick
-            _poll_timer.stop()
-            _hw = _gpu_result[0]
-            if _hw:
-                self.hw_check.setEnabled(True)
-                self.hw_check.setChecked(True)
-                self.hw_lbl.setText(f"✓ {_hw['name']}")
-                self.hw_lbl.setStyleSheet(f"color:{_T()['green']};font-size:10px;")
-                self.hw_check.setToolTip(f"✓ {_hw['name']} ({_hw['h264']})")
-            else:
-                self.hw_lbl.setText("No GPU encoder found")
-                self.hw_lbl.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
-                self.hw_check.setToolTip("No GPU encoder found (NVENC/AMF/QSV/VAAPI)")
-            self._update_size_hint()
-
-        _poll_timer = QTimer(self)
-        _poll_timer.setInterval(500)   # check every 500ms
-        _poll_timer.timeout.connect(_poll_gpu)
-        _poll_timer.start()
-
         upscale_row = QHBoxLayout()
         self._upscale_lbl = QLabel("Upscale output:")
-        self._upscale_lbl.setStyleSheet(f"color:{_T()['text']};font-size:11px;")
+        self._upscale_lbl.setProperty("role", "text")
         self.upscale_combo = QComboBox()
-        self.upscale_combo.addItems(["Off", "1440p  (2560×1440)", "2.7K  (2688×1512)", "4K  (3840×2160)"])
-        self.upscale_combo.setStyleSheet(COMBO_STYLE)
+        self.upscale_combo.addItems(_UPSCALE_LABELS)
         self.upscale_combo.setToolTip(
             "Scale the output video to a higher resolution using Lanczos.\n"
             "Useful when source is 1080p and you want a sharper result on a high-res display."
@@ -1507,13 +1870,13 @@ class MainWindow(QMainWindow):
         rl.addWidget(self.prog)
 
         self.status = QLabel("Ready")
-        self.status.setStyleSheet(f"color:{_T()['muted']};font-size:10px;")
+        self.status.setProperty("role", "hint")
         self.status.setWordWrap(True)
         rl.addWidget(self.status)
 
         # OSD trimmed warning (hidden by default)
         self.osd_warn = QLabel("⚠ No OSD elements in trim window — rendering without OSD overlay")
-        self.osd_warn.setStyleSheet(f"color:{_T()['orange']};font-size:10px;")
+        self.osd_warn.setProperty("role", "warn")
         self.osd_warn.setWordWrap(True)
         self.osd_warn.setVisible(False)
         rl.addWidget(self.osd_warn)
@@ -1525,14 +1888,14 @@ class MainWindow(QMainWindow):
         self.render_btn = QPushButton("  Render Video")
         self.render_btn.setIcon(_icon("render.png", 20))
         self.render_btn.setFixedHeight(42)
-        self.render_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        self.render_btn.setStyleSheet(BTN_PRIMARY)
+        self.render_btn.setFont(_ui_font(11, bold=True))
+        self.render_btn.setProperty("variant", "primary")
         self.render_btn.clicked.connect(self._render)
 
         self.stop_btn = QPushButton()
         self.stop_btn.setIcon(_icon("stop.png", 20))
         self.stop_btn.setFixedSize(42, 42)
-        self.stop_btn.setStyleSheet(BTN_STOP)
+        self.stop_btn.setProperty("variant", "stop")
         self.stop_btn.setToolTip("Stop render")
         self.stop_btn.clicked.connect(self._stop_render)
         self.stop_btn.setEnabled(False)
@@ -1541,65 +1904,90 @@ class MainWindow(QMainWindow):
         btn_row.addWidget(self.stop_btn)
         rl.addLayout(btn_row)
 
-        # FFmpeg status
-        self.ffmpeg_lbl = QLabel()
+        # FFmpeg status — filled in by the background probe below
+        self.ffmpeg_lbl = QLabel("Checking FFmpeg…")
+        self.ffmpeg_lbl.setProperty("role", "hint")
         self.ffmpeg_lbl.setWordWrap(True)
-        self._refresh_ffmpeg_status()
         rl.addWidget(self.ffmpeg_lbl)
 
-
         rl.addStretch()
 
-        # ── Assemble root layout ──────────────────────────────────────────────
-        root.addWidget(left_scroll)
-        root.addWidget(centre, 1)
-        root.addWidget(right)
-
-        # Vertical dividers
-        for w in (left_scroll, centre):
-            div = QFrame()
-            div.setFrameShape(QFrame.Shape.VLine)
-            self._dividers = getattr(self, '_dividers', [])
-            self._dividers.append(div)
-            div.setStyleSheet(f"color:{_T()['border']};")
-            div.setFixedWidth(1)
-            root.insertWidget(root.indexOf(w) + 1, div)
+        # Kick off FFmpeg + GPU detection in background; both results come back
+        # through _gpu_detected (queued onto the GUI thread — no polling timer)
+        def _detect_gpu():
+            _ffp = _hw = None
+            try:
+                _ffp = find_ffmpeg()
+                _hw  = detect_hw_encoder(_ffp) if _ffp else None
+            except Exception:
+                pass
+            self._gpu_detected.emit(_ffp, _hw)
 
-        # Collect buttons and labels for theme reapply
-        # (theme uses findChildren — no explicit list needed)
+        self._gpu_detected.connect(self._apply_gpu_result)
+        threading.Thread(target=_detect_gpu, daemon=True).start()
 
-        QTimer.singleShot(200, lambda: self._on_fw_changed("Betaflight"))
+    @property
+    def cache_bar(self) -> CacheBar:
+        """Preview-cache progress bar, created on first use (first prefetch)."""
+        if self._cache_bar is None:
+            lay, idx = self._cache_bar_slot
+            self._cache_bar = CacheBar()
+            lay.insertWidget(idx, self._cache_bar)
+        return self._cache_bar
+
+    def _apply_gpu_result(self, ffp, hw):
+        self._show_ffmpeg_status(ffp)
+        if hw:
+            self.hw_check.setEnabled(True)
+            self.hw_check.setChecked(True)
+            self.hw_lbl.setText(f"✓ {hw['name']}")
+            _set_role(self.hw_lbl, "ok")
+            self.hw_check.setToolTip(f"✓ {hw['name']} ({hw['h264']})")
+        else:
+            self.hw_lbl.setText("No GPU encoder found")
+            _set_role(self.hw_lbl, "hint")
+            self.hw_check.setToolTip("No GPU encoder found (NVENC/AMF/QSV/VAAPI)")
+        self._update_size_hint()
 
     def _on_codec_changed(self):
         self._update_size_hint()
 
+    # Log-scale bitrate slider ↔ Mbit/s, tabulated once: 1–100 Mbit/s over 0–1000
+    _SL_TO_MBPS = tuple(max(1, min(100, round(math.exp(p / 1000 * math.log(100)))))
+                        for p in range(1001))
+    _MBPS_TO_SL = tuple(round(math.log(max(1, v)) / math.log(100) * 1000)
+                        for v in range(101))
+
     @staticmethod
     def _mbps_to_slider(mbps):
-        mbps = max(1, min(100, int(mbps)))
-        return round(math.log(mbps) / math.log(100) * 1000)
+        return MainWindow._MBPS_TO_SL[max(1, min(100, int(mbps)))]
 
     def _on_mbps_sl_changed(self, pos):
-        v = max(1, min(100, round(math.exp(pos / 1000 * math.log(100)))))
+        v = self._SL_TO_MBPS[max(0, min(1000, pos))]
         self.mbps_spin.blockSignals(True)
         self.mbps_spin.setValue(v)
         self.mbps_spin.blockSignals(False)
-        self._update_size_hint()
+        self._size_hint_timer.start()
 
     def _on_mbps_spin_changed(self, v):
         self.mbps_sl.blockSignals(True)
         self.mbps_sl.setValue(self._mbps_to_slider(v))
         self.mbps_sl.blockSignals(False)
-        self._update_size_hint()
+        self._size_hint_timer.start()
 
     def _update_size_hint(self):
-        if self.video_dur <= 0:
-            self.size_hint.setText("")
-            return
         # Use trimmed duration for estimate if trim is set
         in_pct  = self.trim_sel.in_pct  if hasattr(self, 'trim_sel') else 0.0
         out_pct = self.trim_sel.out_pct if hasattr(self, 'trim_sel') else 1.0
-        dur     = self.video_dur * (out_pct - in_pct)
         mbps    = self.mbps_spin.value()
+        key = (self.video_dur, in_pct, out_pct, mbps, self.source_mbps)
+        if key == self._size_hint_key:
+            return
+        self._size_hint_key = key
+        if self.video_dur <= 0:
+            self.size_hint.setText("")
+            return
+        dur     = self.video_dur * (out_pct - in_pct)
         est_mb  = mbps * dur / 8
         src_note = f"  src {self.source_mbps:.1f} Mbit/s" if self.source_mbps > 0.1 else ""
         self.size_hint.setText(f"≈ {est_mb:.0f} MB at {mbps} Mbit/s{src_note}")
@@ -1616,7 +2004,7 @@ class MainWindow(QMainWindow):
                 if n.upper().startswith(p.upper()):
                     return n[len(p):]
             return n
-        for name in self._font_db:
+        for name in sorted(self._font_db):
             self.style_combo.addItem(_clean(name), userData=name)
         self.style_combo.blockSignals(False)
         for i in range(self.style_combo.count()):
@@ -1640,10 +2028,10 @@ class MainWindow(QMainWindow):
             v = "HD" if self.hd_check.isChecked() else "SD"
             nc = f", {self.font_obj.n_cols}×256 chars" if self.font_obj.n_cols > 1 else ""
             self.font_lbl.setText(f"✓ {raw_name} ({v})  {self.font_obj.tile_w}×{self.font_obj.tile_h}px{nc}")
-            self.font_lbl.setStyleSheet(f"color:{_T()['green']};font-size:10px;")
+            _set_role(self.font_lbl, "ok")
         else:
             self.font_lbl.setText(f"✗ Could not load {raw_name}")
-            self.font_lbl.setStyleSheet(f"color:{_T()['red']};font-size:10px;")
+            _set_role(self.font_lbl, "error")
         self._refresh_preview()
 
     def _custom_font(self):
@@ -1652,7 +2040,7 @@ class MainWindow(QMainWindow):
             self.font_obj = load_font_from_file(p)
             if self.font_obj:
                 self.font_lbl.setText(f"✓ Custom: {os.path.basename(p)}")
-                self.font_lbl.setStyleSheet(f"color:{_T()['green']};font-size:10px;")
+                _set_role(self.font_lbl, "ok")
                 self._refresh_preview()
 
     # ── File selection ────────────────────────────────────────────────────────
@@ -1698,9 +2086,7 @@ class MainWindow(QMainWindow):
     # ── Theme ─────────────────────────────────────────────────────────────────
 
     def _on_scale_changed(self, idx: int):
-        global _UI_SCALE
-        _UI_SCALE = [1.0, 1.25, 1.5, 1.75][idx]
-        _build_styles()
+        _set_ui_scale(_SCALE_VALS[idx])
         self._apply_theme()
         _save_settings()
 
@@ -1729,135 +2115,66 @@ class MainWindow(QMainWindow):
         if self._theme_editor_dlg:
             self._theme_editor_dlg.reload_from_theme()   # sync editor panels
 
+    # Palette tokens each _apply_theme group reads. The editor re-applies on
+    # every tweak, so groups whose tokens didn't change are skipped.
+    _THEME_GROUPS = {
+        "icons":   ("icon", "bg"),
+        "preview": ("bg2", "border", "subtext", "border2", "muted", "accent"),
+        "paint":   ("surface", "accent", "accent2", "text", "muted", "bg"),
+    }
+
+    def _theme_group_changed(self, group: str) -> bool:
+        """True (and remember it) if the tokens behind `group` changed since last apply."""
+        t = _T()
+        h = hash((_DARK_THEME, _UI_SCALE,
+                  tuple(t[k] for k in self._THEME_GROUPS[group])))
+        if self._theme_hashes.get(group) == h:
+            return False
+        self._theme_hashes[group] = h
+        return True
+
     def _apply_theme(self):
         """Reapply all stylesheets after a theme change."""
         t = _T()
-        self.setStyleSheet(APP_STYLE)
-
-        # Palette + theme toggle buttons
-        _icon_btn_ss = (
-            f"QPushButton{{background:transparent;border:none;border-radius:15px;}}"
-            f"QPushButton:hover{{background:{t['surface']};}}"
-        )
-        self._palette_btn.setStyleSheet(_icon_btn_ss)
-        self._theme_btn.setIcon(_icon("moon-dark.png" if _DARK_THEME else "moon-light.png", 18))
-        self._theme_btn.setStyleSheet(
-            f"QPushButton{{background:transparent;border:none;border-radius:15px;}}"
-            f"QPushButton:hover{{background:{t['surface']};}}"
-        )
-        self._h1.setFont(QFont("Segoe UI", _fs(16), QFont.Weight.Bold))
-        self._h1.setStyleSheet(f"color:{t['text']};")
-        self._ver_lbl.setFont(QFont("Segoe UI", _fs(8)))
-        self._ver_lbl.setStyleSheet(f"color:{t['muted']};")
-        self._h2.setFont(QFont("Segoe UI", _fs(16), QFont.Weight.Bold))
-        self._h2.setStyleSheet(f"color:{t['text']};")
-        self._scale_lbl.setStyleSheet(f"color:{t['muted']};font-size:{_fs(10)}px;")
-        self._prev_lbl.setStyleSheet(f"color:{t['subtext']};")
-        self._out_hdr.setStyleSheet(f"color:{t['subtext']};")
-
-        self._left_scroll.setStyleSheet(
-            f"QScrollArea{{border:none;background:transparent;}}"
-            f"QScrollBar:vertical{{background:{t['bg']};width:6px;border-radius:3px;}}"
-            f"QScrollBar::handle:vertical{{background:{t['surface2']};border-radius:3px;}}"
-        )
-
-        # Structural widgets
-        for gb in self.findChildren(QGroupBox):
-            gb.setStyleSheet(GROUP_STYLE)
-        for sl in self.findChildren(QSlider):
-            sl.setStyleSheet(SLIDER_STYLE)
-        for cb in self.findChildren(QComboBox):
-            cb.setStyleSheet(COMBO_STYLE)
-        for ck in self.findChildren(QCheckBox):
-            ck.setStyleSheet(f"color:{t['text']};font-size:{_fs(11)}px;")
-        for div in getattr(self, '_dividers', []):
-            div.setStyleSheet(f"color:{t['border']};")
-        for w in self.findChildren(LabeledSlider):
-            w.refresh_theme()
-        for w in self.findChildren(InfoCard):
-            w.refresh_theme()
-
-        # File rows
-        for row in [self.video_row, self.osd_row, self.srt_row, self.out_row]:
-            row._name_lbl.setStyleSheet(f"color:{t['subtext']}")
-            row.path_lbl.setStyleSheet(PATH_FILLED if row.path else PATH_EMPTY)
-            row.btn.setStyleSheet(BTN_SEC)
-            row.clr.setStyleSheet(BTN_DANGER)
+        # The window/preview/drop-zone sheets are compared by _set_sheet itself
+        _set_sheet(self, APP_STYLE)
+        # Labels, groups, sliders, combos, checkboxes, spinboxes and dividers
+        # are all styled through APP_STYLE above — no per-widget sweep needed
         self.drop_zone.refresh_theme()
 
-        # Preview panel
-        self._preview_panel.setStyleSheet(
-            f"background:{t['bg2']};border:1px solid {t['border']};border-radius:8px;")
-        if self._preview_panel._pil_img is None:
-            self._preview_panel._redraw_placeholder()
-
-        # Buttons + icon retint
-        self.render_btn.setStyleSheet(BTN_PRIMARY)
-        self.stop_btn.setStyleSheet(BTN_STOP)
-        self.restart_btn.setStyleSheet(BTN_PLAY)
-        self.play_btn.setStyleSheet(BTN_PLAY)
-        # Render has a coloured (accent) bg → white icon; stop has red bg → white icon
-        _render_ico_col = "#ffffff" if not _DARK_THEME else t['bg']
-        self.render_btn.setIcon(_icon("render.png", 20, _render_ico_col))
-        self.stop_btn.setIcon(_icon("stop.png", 20, "#ffffff"))
-        # Play/restart sit on a neutral surface → use the theme icon colour
-        self.restart_btn.setIcon(_icon("rewind.png", 20))
-        _play_name = "pause.png" if self._playing else "play.png"
-        self.play_btn.setIcon(_icon(_play_name, 22))
-        # File row icons
-        for row in [self.video_row, self.osd_row, self.srt_row, self.out_row]:
-            row.retint()
-        self._custom_btn.setStyleSheet(BTN_SEC)
-        self._ref_btn.setStyleSheet(BTN_SEC)
-        self._rst_pos_btn.setStyleSheet(BTN_SEC)
-        self._rst_offset_btn.setStyleSheet(BTN_SEC)
-        self._trim_rst_btn.setStyleSheet(BTN_SEC)
-        self.trim_sel.update()
-
-        # SpinBoxes
-        _sb_style = (
-            f"QSpinBox{{background:{t['surface']};color:{t['text']};"
-            f"border:1px solid {t['border2']};border-radius:4px;padding:3px 6px;}}"
-            f"QSpinBox::up-button,QSpinBox::down-button{{width:16px;"
-            f"background:{t['surface2']};border-radius:2px;}}"
-        )
-        self.mbps_spin.setStyleSheet(_sb_style)
-        self.osd_offset_sb.setStyleSheet(_sb_style)
-
-        # Progress bar — repaint with new theme colours
-        self.prog.update()
-
-        # Inline subtext labels (constructed with hardcoded colours at init time)
-        for lbl, style in [
-            (self.frame_info,    f"color:{t['muted']};font-size:{_fs(10)}px;"),
-            (self.size_hint,     f"color:{t['muted']};font-size:{_fs(10)}px;"),
-            (self.status,        f"color:{t['muted']};font-size:{_fs(10)}px;"),
-            (self.frame_lbl,     f"color:{t['text']};font-size:{_fs(11)}px;font-weight:bold;"),
-            (self.osd_warn,      f"color:{t['orange']};font-size:{_fs(10)}px;"),
-            (self._sync_lbl,     f"color:{t['subtext']};font-size:{_fs(11)}px;"),
-
-            (self._st_lbl,       f"color:{t['subtext']};font-size:{_fs(11)}px;"),
-            (self._codec_lbl,    f"color:{t['subtext']};font-size:{_fs(11)}px;"),
-            (self._mbps_lbl,     f"color:{t['subtext']};font-size:{_fs(11)}px;"),
-            (self._upscale_lbl,  f"color:{t['text']};font-size:{_fs(11)}px;"),
-        ]:
-            lbl.setStyleSheet(style)
-
-        # font_lbl — preserve its success/error state colour if already set
-        fl_ss = self.font_lbl.styleSheet()
-        if "green" not in fl_ss and t['green'] not in fl_ss:
-            # still in initial/error state — use orange (no font) or current red
-            if "red" not in fl_ss and t['red'] not in fl_ss:
-                self.font_lbl.setStyleSheet(f"color:{t['orange']};font-size:{_fs(10)}px;")
-
-        # hw_lbl — preserve detected GPU green, only reset if still pending/absent
-        hw_text = self.hw_lbl.text()
-        if hw_text.startswith("Detecting") or hw_text.startswith("No GPU") or hw_text == "":
-            self.hw_lbl.setStyleSheet(f"color:{t['muted']};font-size:{_fs(10)}px;")
-        elif hw_text.startswith("✓"):
-            self.hw_lbl.setStyleSheet(f"color:{t['green']};font-size:{_fs(10)}px;")
-
-        self._refresh_preview()
+        if self._theme_group_changed("icons"):
+            # Theme toggle icon (both header buttons are styled by APP_STYLE)
+            self._theme_btn.setIcon(_icon("moon-dark.png" if _DARK_THEME else "moon-light.png", 18))
+            self._h1.setFont(_ui_font(_fs(16), bold=True))
+            self._ver_lbl.setFont(_ui_font(_fs(8)))
+            self._h2.setFont(_ui_font(_fs(16), bold=True))
+
+            # Button variants come from APP_STYLE; only the icons need retinting
+            # Render has a coloured (accent) bg → white icon; stop has red bg → white icon
+            _render_ico_col = "#ffffff" if not _DARK_THEME else t['bg']
+            self.render_btn.setIcon(_icon("render.png", 20, _render_ico_col))
+            self.stop_btn.setIcon(_icon("stop.png", 20, "#ffffff"))
+            # Play/restart sit on a neutral surface → use the theme icon colour
+            self.restart_btn.setIcon(_icon("rewind.png", 20))
+            _play_name = "pause.png" if self._playing else "play.png"
+            self.play_btn.setIcon(_icon(_play_name, 22))
+            # File row icons
+            for row in self._file_rows:
+                row.retint()
+
+        if self._theme_group_changed("preview"):
+            _set_sheet(self._preview_panel, PREVIEW_STYLE)
+            if self._preview_panel._src is None:
+                self._preview_panel._redraw_placeholder()
+            # Debounced — a burst of editor applies re-composites only once
+            self._queue_preview()
+
+        if self._theme_group_changed("paint"):
+            # Trim selector and progress bars — re-cache their paint colours
+            self.trim_sel.refresh_theme()
+            self.prog.refresh_theme()
+            if self._cache_bar is not None:
+                self._cache_bar.refresh_theme()
 
     def _on_video(self):
         p, _ = QFileDialog.getOpenFileName(self, "Select Video", "",
@@ -1881,11 +2198,14 @@ class MainWindow(QMainWindow):
             self.out_row.set_path(self._make_output_path(path))
         self._prefetch_stop = True           # signal any running prefetch to abort
         self.cached_frames.clear()
-        self.cache_bar.finish()
+        self._cached_pcts_sorted.clear()
+        self._composite_cache.clear()        # drop the old video's frames too
+        self._composite_bytes = 0
+        self._last_composite = None
+        if self._cache_bar is not None:
+            self._cache_bar.finish()
         self._st("Reading video info…")
-        self._vi = VideoInfoWorker(path)
-        self._vi.result.connect(self._got_vid_info)
-        self._vi.start()
+        QThreadPool.globalInstance().start(VideoInfoTask(path, self._video_info))
         self._extract_at_pct(0)
 
     def _got_vid_info(self, info):
@@ -1893,6 +2213,8 @@ class MainWindow(QMainWindow):
         if "error" not in info:
             self.video_fps = info.get("fps", 60.0)
             self.video_dur = info.get("duration", 0.0)
+            self._video_dur_ms = int(self.video_dur * 1000)
+            self.video_size = (info.get("width", 0) or 0, info.get("height", 0) or 0)
             size_mb = info.get("size_mb", 0) or 0
             # Source bitrate in Mbit/s — auto-sets the output bitrate spinbox
             self.source_mbps = (size_mb * 8 / max(self.video_dur, 1)) if self.video_dur > 0 else 0
@@ -1913,7 +2235,7 @@ class MainWindow(QMainWindow):
 
     def _start_prefetch(self):
         """Begin background frame extraction across ~20 evenly-spaced positions."""
-        if not self.video_row.path or self.video_dur <= 0 or not find_ffmpeg():
+        if not self.video_row.path or self.video_dur <= 0 or not self._ffmpeg():
             return
         # 20 evenly-spaced positions: 0, 5, 10, … 95, 100 %
         positions = list(range(0, 101, 5))
@@ -1929,47 +2251,139 @@ class MainWindow(QMainWindow):
             daemon=True
         ).start()
 
+    _PREFETCH_WORKERS = min(4, os.cpu_count() or 1)
+
     def _prefetch_frames(self, positions):
-        """Worker thread: extract one frame per position, update CacheBar."""
-        ffmpeg = find_ffmpeg()
-        if not ffmpeg: return
-        done = 0
-        for pct in positions:
-            if self._prefetch_stop:
-                break
-            if pct in self.cached_frames:
-                done += 1
-                QTimer.singleShot(0, lambda d=done: self.cache_bar.update_count(d))
-                continue
-            t = self.video_dur * pct / 100.0
-            tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-            tmp.close()
-            try:
-                proc = _hidden_popen(
-                    [ffmpeg, "-y", "-ss", str(t), "-i", self.video_row.path,
-                     "-vframes", "1", "-q:v", "3", tmp.name],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-                proc.wait(timeout=15)
-                if (not self._prefetch_stop and proc.returncode == 0
-                        and os.path.exists(tmp.name) and PIL_OK):
-                    img = PILImage.open(tmp.name).copy().convert("RGBA")
-                    self.cached_frames[pct] = img
-                    if self.video_frame is None:
-                        self.video_frame = img
-                    done += 1
-                    _d = done
-                    QTimer.singleShot(0, lambda d=_d: self.cache_bar.update_count(d))
-            except Exception:
-                pass
-            finally:
-                try: os.unlink(tmp.name)
-                except: pass
+        """Worker thread: split positions across a few ffmpeg processes, update CacheBar.
+
+        Each process decodes its share through _prefetch_group; the shares are
+        interleaved so the early frames already span the whole timeline.
+        """
+        ffmpeg = self._ffmpeg()
+        w, h   = self.video_size
+        if not ffmpeg or not PIL_OK or w <= 0 or h <= 0:
+            QTimer.singleShot(0, self.cache_bar.finish)
+            return
+        n = max(1, min(self._PREFETCH_WORKERS, len(positions)))
+        progress = {"done": 0, "next_post": 0.0}   # shared, under _cache_lock
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            for i in range(n):
+                pool.submit(self._prefetch_group, ffmpeg, positions[i::n], progress)
         QTimer.singleShot(0, self.cache_bar.finish)
 
+    def _prefetch_group(self, ffmpeg, positions, progress):
+        """Cache every position in `positions`, decoding them all in ONE ffmpeg process.
+
+        If the stream comes up short, the frames that did arrive can't be
+        trusted to match their positions: they are dropped again and each
+        position is re-fetched through its own process instead.
+        """
+        got = self._prefetch_stream(ffmpeg, positions, progress)
+        if got is None or self._prefetch_stop:
+            return
+        if len(got) < len(positions):
+            for pct, _ in got:
+                self._uncache_frame(pct)
+            self._prefetch_progress(progress, -len(got))
+            if len(positions) > 1:
+                for pct in positions:
+                    if self._prefetch_stop:
+                        return
+                    self._prefetch_group(ffmpeg, [pct], progress)
+            return
+        if self.video_frame is None:
+            self.video_frame = got[0][1]
+
+    def _prefetch_stream(self, ffmpeg, positions, progress):
+        """Pull `positions` through one ffmpeg process; return the (pct, img) cached.
+
+        Each position is its own input-seeked (-ss) copy of the video; the
+        first frame of each is concatenated into a single raw RGBA stream on
+        stdout, so the frames arrive in `positions` order without a process
+        start-up (or PNG round trip) per frame. Returns None if ffmpeg failed.
+        """
+        w, h = self.video_size
+        cmd, chains = [ffmpeg, "-v", "error"], []
+        for i, pct in enumerate(positions):
+            # Seeking exactly to the end yields no frame, which would shift
+            # every later frame onto the wrong position — stay just short
+            t = max(0.0, min(self.video_dur * pct / 100.0, self.video_dur - 0.5))
+            cmd += ["-ss", f"{t:.3f}", "-i", self.video_row.path]
+            chains.append(f"[{i}:v]trim=end_frame=1,setpts=PTS-STARTPTS,scale={w}:{h}[v{i}]")
+        graph = (";".join(chains) + ";"
+                 + "".join(f"[v{i}]" for i in range(len(positions)))
+                 + f"concat=n={len(positions)}:v=1:a=0[out]")
+        cmd += ["-filter_complex", graph, "-map", "[out]", "-vsync", "passthrough",
+                "-f", "rawvideo", "-pix_fmt", "rgba", "pipe:1"]
+        frame_bytes = w * h * 4
+        got  = []
+        proc = None
+        try:
+            proc = _hidden_popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            for pct in positions:
+                buf = proc.stdout.read(frame_bytes)
+                if self._prefetch_stop or len(buf) < frame_bytes:
+                    break
+                img = PILImage.frombytes("RGBA", (w, h), buf)
+                self._cache_frame(pct, img)
+                got.append((pct, img))
+                self._prefetch_progress(progress, 1)
+        except Exception:
+            for pct, _ in got:
+                self._uncache_frame(pct)
+            self._prefetch_progress(progress, -len(got))
+            return None
+        finally:
+            if proc is not None:
+                if proc.poll() is None:
+                    try: proc.kill()
+                    except Exception: pass
+                proc.stdout.close()
+                proc.wait()
+        return got
+
+    def _prefetch_progress(self, progress, delta):
+        """Adjust the shared cached-frame count; posts to the CacheBar are
+        coalesced to ~10/s (finish() hides the bar at the end), but a count
+        that goes down is posted at once so the bar never overstates."""
+        with self._cache_lock:
+            progress["done"] += delta
+            now  = time.monotonic()
+            post = delta < 0 or now >= progress["next_post"]
+            if post:
+                progress["next_post"] = now + 0.1
+            done = progress["done"]
+        if post:
+            QTimer.singleShot(0, lambda d=done: self.cache_bar.update_count(d))
+
     def _load_osd(self, path):
+        """Parse the OSD file on the thread pool; _got_osd applies the result."""
+        self._osd_loading = path
+        self._st("Reading OSD file…")
+        QThreadPool.globalInstance().start(OsdParseTask(path, self._osd_parsed))
+
+    def _swap_osd(self, osd):
+        """Make osd the current OSD data and release the previous file."""
+        old, self.osd_data = self.osd_data, osd
+        if old is None:
+            return
+        # Composites hold views of the old frames — drop them so the mapping
+        # can go; a render still using the old file leaves it to GC
+        self._composite_cache.clear()
+        self._composite_bytes = 0
+        self._last_composite = None
+        if not (self.worker and self.worker.isRunning()
+                and self.worker.cfg.osd_data is old):
+            old.close()   # unmap the previous file
+
+    def _got_osd(self, path, result):
+        if path != self._osd_loading:
+            return   # superseded by a later pick
+        self._osd_loading = None
         try:
-            self.osd_data = parse_osd(path)
+            if isinstance(result, Exception):
+                raise result
+            self._swap_osd(result)
             s = self.osd_data.stats
             self.osd_card.clear()
             self.osd_card.add_row("FC",   s.fc_type or "Unknown")
@@ -2001,7 +2415,8 @@ class MainWindow(QMainWindow):
             if not p1_data or not p1_data.frames:
                 self._st("P1 OSD: no frames found")
                 return
-            self.osd_data = p1_to_osd_file(p1_data)
+            self._osd_loading = None   # embedded OSD wins over a pending .osd parse
+            self._swap_osd(p1_to_osd_file(p1_data))
             s = self.osd_data.stats
             self.osd_card.clear()
             self.osd_card.add_row("FC",   s.fc_type or "BetaFPV P1")
@@ -2050,9 +2465,17 @@ class MainWindow(QMainWindow):
 
     def _video_time_ms(self, pct):
         """Map slider 0-100% → absolute video timestamp in ms (full video duration)."""
-        return int(self.video_dur * pct / 100.0 * 1000)
+        return self._video_dur_ms * pct // 100   # pct is the slider's int
+
+    def _queue_frame_sl(self, _pct):
+        """Throttle, not debounce: a drag still updates every 16 ms, but the
+        several valueChanged emissions between two frames collapse into one."""
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
 
     def _on_frame_sl(self, pct):
+        # Scrubbing and playback both land here — draft-quality scaling until idle
+        self.preview.draft()
         # Update text labels immediately for responsiveness
         self.frame_lbl.setText(f"{pct}%")
         t_ms = self._video_time_ms(pct) + self.osd_offset_sb.value()
@@ -2072,8 +2495,7 @@ class MainWindow(QMainWindow):
         if self._playing:
             # During playback: re-composite the nearest cached frame rather than
             # spawning ffmpeg (which is too slow for smooth playback)
-            nearest = min(self.cached_frames.keys(),
-                          key=lambda k: abs(k - pct)) if self.cached_frames else None
+            nearest = self._nearest_cached_pct(pct)
             if nearest is not None:
                 self._show_pct(nearest)
             return
@@ -2082,6 +2504,31 @@ class MainWindow(QMainWindow):
         self._pending_pct = pct
         self._scrub_timer.start()
 
+    def _cache_frame(self, pct, img):
+        """Store a decoded frame, keeping _cached_pcts_sorted in step."""
+        with self._cache_lock:
+            if pct not in self.cached_frames:
+                bisect.insort(self._cached_pcts_sorted, pct)
+            self.cached_frames[pct] = img
+
+    def _uncache_frame(self, pct):
+        with self._cache_lock:
+            if self.cached_frames.pop(pct, None) is not None:
+                try: self._cached_pcts_sorted.remove(pct)
+                except ValueError: pass
+
+    def _nearest_cached_pct(self, pct):
+        """Closest cached position to pct (ties go to the earlier one), or None."""
+        keys = self._cached_pcts_sorted
+        i = bisect.bisect_left(keys, pct)
+        # The prefetch thread may shrink the list under us — clamp, don't index blindly
+        near = keys[max(0, i - 1):i + 1]
+        if not near:
+            return None
+        if len(near) == 2 and near[1] - pct < pct - near[0]:
+            return near[1]
+        return near[0]
+
     def _do_scrub(self):
         """Called ~80ms after the slider stops — extract the frame via ffmpeg."""
         pct = self._pending_pct
@@ -2091,51 +2538,95 @@ class MainWindow(QMainWindow):
             self._extract_at_pct(pct)
 
     def _extract_at_pct(self, pct):
-        if not self.video_row.path or not find_ffmpeg(): return
-        ffmpeg = find_ffmpeg()
+        ffmpeg = self._ffmpeg()
+        if not self.video_row.path or not ffmpeg: return
         # Seek to the absolute timestamp (slider maps to full video)
         t = self.video_dur * pct / 100.0 if self.video_dur > 0 else 0.0
-        tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        tmp.close()
-        # Kill any in-flight extraction so we don't pile up ffmpeg processes
-        if self._extract_proc and self._extract_proc.poll() is None:
-            try: self._extract_proc.kill()
-            except Exception: pass
-        def _run():
-            proc = None
-            try:
-                proc = _hidden_popen(
-                    [ffmpeg, "-y", "-ss", str(t), "-i", self.video_row.path,
-                     "-vframes", "1", "-q:v", "2", tmp.name],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-                self._extract_proc = proc
-                proc.wait(timeout=20)
-                if proc.returncode == 0 and os.path.exists(tmp.name) and PIL_OK:
-                    img = PILImage.open(tmp.name).copy().convert("RGBA")
-                    self.cached_frames[pct] = img
-                    if self.video_frame is None:
-                        self.video_frame = img
-                    def _on_frame_ready(p=pct):
-                        self._show_pct(p)
-                    QTimer.singleShot(0, _on_frame_ready)
-            except Exception:
-                pass
-            finally:
-                try: os.unlink(tmp.name)
-                except: pass
-        threading.Thread(target=_run, daemon=True).start()
+        if self._extractor is None:
+            self._extractor = FrameExtractor(self)
+            # Queued onto the GUI thread, like _video_info
+            self._extractor.extracted.connect(self._on_frame_extracted)
+            QApplication.instance().aboutToQuit.connect(self._extractor.stop)
+            self._extractor.start()
+        # Supersedes (and kills) any in-flight extraction — no ffmpeg pile-up
+        self._extractor.request(ffmpeg, self.video_row.path, t, pct)
+
+    def _on_frame_extracted(self, pct, img):
+        self._cache_frame(pct, img)
+        if self.video_frame is None:
+            self.video_frame = img
+        self._show_pct(pct)
 
     def _show_pct(self, pct):
         img = self.cached_frames.get(pct)
-        if img: self.preview.show_frame(self._composite(img, pct))
+        if img: self._show_composite(img, pct)
+
+    def _preview_hidden(self) -> bool:
+        """True while a composite couldn't be seen — marks the preview stale."""
+        if self.preview.isVisible() and not self.isMinimized():
+            return False
+        self._preview_dirty = True
+        return True
+
+    def _catch_up_preview(self):
+        """Run the refresh that _preview_hidden skipped, once we're visible again."""
+        if self._preview_dirty and not self.isMinimized():
+            self._preview_dirty = False
+            self._queue_preview()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._catch_up_preview()
+
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() == QEvent.Type.WindowStateChange:   # e.g. un-minimised
+            self._catch_up_preview()
 
     def _refresh_preview(self):
+        if self._preview_hidden():
+            return
         pct = self.frame_sl.value()
         img = self.cached_frames.get(pct) or self.video_frame
-        if img: self.preview.show_frame(self._composite(img, pct))
+        if img: self._show_composite(img, pct)
 
-    def _composite(self, img, pct):
+    def _show_composite(self, img, pct):
+        """Composite img for pct and show it, reusing a cached result when every
+        input (frame, OSD frame, font, overlay settings) is unchanged."""
+        if self._preview_hidden():
+            return
+        osd_frame, cfg = self._overlay_inputs(pct)
+        font = self.font_obj if PIL_OK else None
+        # Fast path: playback ticks often land on the same OSD packet as the
+        # last one — identity checks plus dataclass == skip astuple() and the hash
+        last = self._last_composite
+        if (last is not None and last[0] is img and last[1] is osd_frame
+                and last[2] is font and last[3] == cfg):
+            self.preview.show_image(last[4])
+            return
+        key  = (id(img), id(osd_frame), id(font), dataclasses.astuple(cfg))
+        hit  = self._composite_cache.get(key)
+        if hit is not None:
+            self._last_composite = (img, osd_frame, font, cfg, hit[0])
+            self.preview.show_image(hit[0])
+            return
+        if font:
+            out = render_osd_frame(img, osd_frame, font, cfg)
+        else:
+            out = render_fallback(img, osd_frame, cfg)
+        qi = self.preview.show_frame(out)
+        if qi is None:
+            return
+        self._last_composite = (img, osd_frame, font, cfg, qi)
+        # The entry holds the keyed objects, so their ids stay unique while cached
+        self._composite_cache[key] = (qi, img, osd_frame, font)
+        self._composite_bytes += qi.sizeInBytes()
+        while self._composite_bytes > self._COMPOSITE_CACHE_BYTES:
+            old = self._composite_cache.pop(next(iter(self._composite_cache)))
+            self._composite_bytes -= old[0].sizeInBytes()
+
+    def _overlay_inputs(self, pct):
+        """Return (osd_frame, OsdRenderConfig) for the preview at pct."""
         t_ms     = self._video_time_ms(pct) + self.osd_offset_sb.value()
         osd_frame = self.osd_data.frame_at_time(t_ms) if self.osd_data else None
         srt_text = ""
@@ -2151,9 +2642,7 @@ class MainWindow(QMainWindow):
             srt_opacity  = self.srt_opacity_sl.value() / 100.0,
             srt_scale    = self.srt_size_sl.value() / 100.0,
         )
-        if self.font_obj and PIL_OK:
-            return render_osd_frame(img, osd_frame, self.font_obj, cfg)
-        return render_fallback(img, osd_frame, cfg)
+        return osd_frame, cfg
 
     def _on_osd_offset_changed(self, value: int):
         global _OSD_OFFSET_MS
@@ -2168,7 +2657,7 @@ class MainWindow(QMainWindow):
         self._refresh_preview()
 
     def _queue_preview(self):
-        """Debounced preview refresh — fires 60ms after sliders stop moving."""
+        """Debounced preview refresh — fires 33ms after the last slider/trim change."""
         self._preview_timer.start()
 
     # ── Playback ──────────────────────────────────────────────────────────────
@@ -2210,7 +2699,7 @@ class MainWindow(QMainWindow):
             self._play_pause()   # reached end — stop
         else:
             self.frame_sl.setValue(nxt)
-            # _on_frame_sl fires automatically via valueChanged
+            # _on_frame_sl follows via valueChanged (throttled by _frame_timer)
 
     # ── Trim ─────────────────────────────────────────────────────────────────
 
@@ -2222,17 +2711,12 @@ class MainWindow(QMainWindow):
     def _on_trim_changed(self, in_pct, out_pct):
         self.trim_in_lbl.setText(f"In: {self._fmt_trim_time(in_pct)}")
         self.trim_out_lbl.setText(f"Out: {self._fmt_trim_time(out_pct)}")
-        self._refresh_preview()
+        self._queue_preview()
 
     @staticmethod
     def _clean_stem(stem: str) -> str:
         """Strip any existing _osd or _osd_<timestamps> suffix from a stem."""
-        import re
-        # Remove _osd_NNNN-NNNN timestamp suffix variants
-        stem = re.sub(r'_osd_\d+[-_]\d+$', '', stem)
-        # Remove bare _osd suffix
-        stem = re.sub(r'_osd$', '', stem)
-        return stem
+        return _STEM_OSD_RE.sub('', _STEM_TS_RE.sub('', stem))
 
     def _make_output_path(self, video_path: str, trim_start_s: float = 0.0,
                           trim_end_s: float = 0.0) -> str:
@@ -2275,17 +2759,26 @@ class MainWindow(QMainWindow):
 
     # ── Render ────────────────────────────────────────────────────────────────
 
+    def _ffmpeg(self) -> Optional[str]:
+        """find_ffmpeg(), resolved once — the detection thread or an install fills it in."""
+        if not self._ffmpeg_resolved:
+            self._ffmpeg_path, self._ffmpeg_resolved = find_ffmpeg(), True
+        return self._ffmpeg_path
+
     def _refresh_ffmpeg_status(self):
-        ffp = find_ffmpeg()
+        self._show_ffmpeg_status(find_ffmpeg())
+
+    def _show_ffmpeg_status(self, ffp):
+        self._ffmpeg_path, self._ffmpeg_resolved = ffp, True
         if ffp:
             self.ffmpeg_lbl.setText("✓ FFmpeg found")
-            self.ffmpeg_lbl.setStyleSheet(f"color:{_T()['green']};font-size:10px;")
+            _set_role(self.ffmpeg_lbl, "ok")
             self.ffmpeg_lbl.setToolTip(ffp)
             if hasattr(self, "ffmpeg_install_btn"):
                 self.ffmpeg_install_btn.setVisible(False)
         else:
             self.ffmpeg_lbl.setText("⚠ FFmpeg not found")
-            self.ffmpeg_lbl.setStyleSheet(f"color:{_T()['red']};font-size:10px;")
+            _set_role(self.ffmpeg_lbl, "error")
             self.ffmpeg_lbl.setToolTip("")
 
     def _install_ffmpeg(self):
@@ -2335,7 +2828,7 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass
                     self._refresh_ffmpeg_status()
-                    if find_ffmpeg():
+                    if self._ffmpeg_path:
                         self._st("✓ FFmpeg installed successfully")
                     else:
                         self._st("FFmpeg installed — restart app to detect it")
@@ -2353,18 +2846,22 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Missing", "Select a video file."); return
         if not self.out_row.path:
             QMessageBox.warning(self, "Missing", "Choose output location."); return
-        if not find_ffmpeg():
+        if self._osd_loading:
+            self._st("Still reading the OSD file — try again in a moment")
+            return
+        if not self._ffmpeg():
+            self._refresh_ffmpeg_status()   # a miss may be stale — re-check once
+        if not self._ffmpeg():
             QMessageBox.critical(self, "FFmpeg Missing",
                 "FFmpeg not found.\n\nRun 'VueOSD.bat' to install it automatically,\n"
                 "or install manually from https://www.gyan.dev/ffmpeg/builds/")
             return
 
-        codec_map = {"H.264 (libx264)": "libx264", "H.265 (libx265)": "libx265"}
-        codec = codec_map.get(self.codec_cb.currentText(), "libx264")
+        codec = _CODECS[max(0, self.codec_cb.currentIndex())]
 
         font_folder = None
         if self.font_obj is not None:
-            fonts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+            fonts_dir = os.path.join(_MODULE_DIR, "fonts")
             candidate = os.path.join(fonts_dir, self.font_obj.name)
             if os.path.isdir(candidate):
                 font_folder = candidate
@@ -2383,7 +2880,7 @@ class MainWindow(QMainWindow):
         # ── Overwrite / rename dialog ─────────────────────────────────────────
         out_path = self.out_row.path
         if out_path and os.path.exists(out_path):
-            dlg = QDialog(self)
+            dlg = QDialog(self)   # styled entirely by the window's APP_STYLE
             dlg.setWindowTitle("File Already Exists")
             dlg.setMinimumWidth(420)
             vl = QVBoxLayout(dlg)
@@ -2393,31 +2890,27 @@ class MainWindow(QMainWindow):
             warn_lbl = QLabel(f"⚠  <b>{os.path.basename(out_path)}</b> already exists in this folder.")
             warn_lbl.setWordWrap(True)
             warn_lbl.setTextFormat(Qt.TextFormat.RichText)
-            warn_lbl.setStyleSheet(f"color:{_T()['text']};font-size:12px;")
             vl.addWidget(warn_lbl)
 
             name_lbl = QLabel("Save as:")
-            name_lbl.setStyleSheet(f"color:{_T()['subtext']};font-size:11px;")
+            name_lbl.setProperty("role", "field")
             vl.addWidget(name_lbl)
 
             name_edit = QLineEdit(os.path.basename(out_path))
-            name_edit.setStyleSheet(
-                f"background:{_T()['bg2']};color:{_T()['text']};"
-                f"border:1px solid {_T()['border2']};border-radius:4px;padding:4px 8px;"
-            )
+            name_edit.setProperty("role", "field")
             name_edit.selectAll()
             vl.addWidget(name_edit)
 
             btn_row2 = QHBoxLayout()
             btn_row2.setSpacing(6)
             overwrite_btn = QPushButton("Overwrite")
-            overwrite_btn.setStyleSheet(BTN_DANGER)
+            overwrite_btn.setProperty("variant", "danger")
             overwrite_btn.setFixedHeight(32)
             save_as_btn = QPushButton("Save with this name")
-            save_as_btn.setStyleSheet(BTN_PRIMARY)
+            save_as_btn.setProperty("variant", "primary")
             save_as_btn.setFixedHeight(32)
             cancel_btn2 = QPushButton("Cancel")
-            cancel_btn2.setStyleSheet(BTN_SEC)
+            cancel_btn2.setProperty("variant", "secondary")
             cancel_btn2.setFixedHeight(32)
             btn_row2.addWidget(cancel_btn2)
             btn_row2.addStretch()
@@ -2434,10 +2927,7 @@ class MainWindow(QMainWindow):
                     new_name += ".mp4"
                 new_path = os.path.join(os.path.dirname(out_path), new_name)
                 if os.path.exists(new_path) and new_path != out_path:
-                    name_edit.setStyleSheet(
-                        f"background:{_T()['bg2']};color:{_T()['red']};"
-                        f"border:1px solid {_T()['red']};border-radius:4px;padding:4px 8px;"
-                    )
+                    _set_role(name_edit, "error")
                     name_lbl.setText("Save as:  ⚠ that file also exists — pick a different name")
                     return
                 _result[0] = new_path
@@ -2447,7 +2937,6 @@ class MainWindow(QMainWindow):
             save_as_btn.clicked.connect(_sa)
             cancel_btn2.clicked.connect(_cancel)
 
-            dlg.setStyleSheet(f"background:{_T()['bg']};")
             if dlg.exec() != QDialog.DialogCode.Accepted:
                 return   # user cancelled
             if _result[0] == "cancel":
@@ -2457,8 +2946,7 @@ class MainWindow(QMainWindow):
                 self.out_row.set_path(_result[0])
 
         # Upscale target from dropdown
-        _upscale_map = {0: "", 1: "1440p", 2: "2.7k", 3: "4k"}
-        upscale_target = _upscale_map.get(self.upscale_combo.currentIndex(), "")
+        upscale_target = _UPSCALE_TARGETS[max(0, self.upscale_combo.currentIndex())]
 
         cfg = ProcessingConfig(
             input_video   = self.video_row.path,
@@ -2481,6 +2969,7 @@ class MainWindow(QMainWindow):
             trim_start    = self.trim_sel.in_pct  * self.video_dur,
             trim_end      = self.trim_sel.out_pct * self.video_dur,
             upscale_target = upscale_target,
+            quality_mode  = _SPEED_MODES[max(0, self.speed_cb.currentIndex())],
             osd_offset_ms = self.osd_offset_sb.value(),
         )
 
@@ -2494,9 +2983,7 @@ class MainWindow(QMainWindow):
         if self.osd_data and self.video_dur > 0:
             t_start_ms = int(self.trim_sel.in_pct  * self.video_dur * 1000)
             t_end_ms   = int(self.trim_sel.out_pct * self.video_dur * 1000)
-            in_window = [fr for fr in self.osd_data.frames
-                         if t_start_ms <= fr.time_ms <= t_end_ms + 500]
-            if not in_window:
+            if not self.osd_data.has_frames_between(t_start_ms, t_end_ms + 500):
                 self.osd_warn.setVisible(True)
 
         self.worker = ProcessWorker(cfg)
@@ -2564,7 +3051,7 @@ def main():
     app.setStyle("Fusion")
     app.setApplicationName("VueOSD")
     app.setOrganizationName("VueOSD")
-    _icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icon.png")
+    _icon_path = os.path.join(_ASSETS_DIR, "icon.png")
     if os.path.exists(_icon_path):
         app.setWindowIcon(QIcon(_icon_path))
 
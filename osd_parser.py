@@ -35,16 +35,22 @@ function rx_video_recording_data_add_osd_frame):
 """
 
 from __future__ import annotations
-import struct, re, bisect
+import bisect, mmap, os, traceback
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+import numpy as np
+
 HEADER_SIZE     = 40
 GRID_COLS       = 53
 GRID_ROWS       = 20
 CHARS_PER_FRAME = GRID_COLS * GRID_ROWS   # 1060
 FRAME_SIZE      = 4 + CHARS_PER_FRAME * 2 # 2124  (u32 ts + 1060×u16)
 
+# One on-disk frame as a packed record, so the whole body maps in one call
+FRAME_DT = np.dtype([('ts', '<u4'), ('grid', '<u2', (CHARS_PER_FRAME,))])
+assert FRAME_DT.itemsize == FRAME_SIZE
+
 FC_TYPES: dict[bytes, str] = {
     b'BTFL': 'Betaflight',
     b'INAV': 'INAV',
@@ -65,20 +71,25 @@ class FlightStats:
     blackbox_pct:   Optional[str]   = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OsdFrame:
-    """Complete snapshot of the MSP OSD screen at this timestamp."""
+    """Complete snapshot of the MSP OSD screen at this timestamp.
+
+    `grid` is a uint16 row view into the file-wide array (see parse_osd), so a
+    frame costs three slots — cells are only boxed when a frame is drawn.
+    """
     index:   int
     time_ms: int
-    grid:    List[int]   # flat len=1060;  0 = transparent
+    grid:    np.ndarray   # flat len=1060 uint16;  0 = transparent
 
     def char_at(self, row: int, col: int) -> int:
-        return self.grid[row * GRID_COLS + col]
+        return int(self.grid[row * GRID_COLS + col])
 
     def non_empty(self) -> list[tuple[int, int, int]]:
         """Return [(row, col, char_code), ...] for all visible (non-zero) cells."""
-        return [(i // GRID_COLS, i % GRID_COLS, c)
-                for i, c in enumerate(self.grid) if c != 0]
+        nz = np.flatnonzero(self.grid)
+        return list(zip((nz // GRID_COLS).tolist(), (nz % GRID_COLS).tolist(),
+                        self.grid[nz].tolist()))
 
 
 @dataclass
@@ -86,6 +97,22 @@ class OsdFile:
     stats:      FlightStats       = field(default_factory=FlightStats)
     frames:     List[OsdFrame]    = field(default_factory=list)
     timestamps: List[int]         = field(default_factory=list)  # ms, ascending
+    _ts_arr:    Optional[np.ndarray] = None   # timestamps as an array (parse_osd)
+    _mm:        Optional[mmap.mmap]  = None   # file mapping the frame views point into
+
+    def close(self):
+        """Drop the frames and release the file mapping they point into.
+
+        The file's own views go first; if a frame is still held elsewhere
+        (e.g. by a preview cache) the unmap is left to garbage collection.
+        """
+        self.frames, self.timestamps, self._ts_arr = [], [], None
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass
+            self._mm = None
 
     @property
     def frame_count(self) -> int:
@@ -110,49 +137,72 @@ class OsdFile:
         idx = max(0, min(idx, len(self.frames) - 1))
         return self.frames[idx]
 
+    def has_frames_between(self, start_ms: int, end_ms: int) -> bool:
+        """True if any frame's timestamp lies in [start_ms, end_ms]."""
+        # Two binary searches — no pass over the frames
+        return (bisect.bisect_left(self.timestamps, start_ms)
+                < bisect.bisect_right(self.timestamps, end_ms))
+
+    def frame_indices_for_times(self, times_ms: np.ndarray) -> np.ndarray:
+        """Vectorised frame_at_time: the frame index for each time in times_ms.
+
+        One searchsorted call maps a whole render's worth of video timestamps,
+        instead of a Python bisect per output frame.
+        """
+        ts = self._ts_arr if self._ts_arr is not None else np.asarray(self.timestamps)
+        idx = np.searchsorted(ts, times_ms, side='right') - 1
+        return np.clip(idx, 0, len(self.frames) - 1)
+
 
 # ── Stats extraction from first (stats-screen) OSD frame ──────────────────────
 
+# char code → printable ASCII byte, anything else → space
+_ASCII_LUT = np.full(65536, 0x20, dtype=np.uint8)
+_ASCII_LUT[32:127] = np.arange(32, 127, dtype=np.uint8)
+
+# ASCII control characters (and DEL) for str.translate to delete
+_CTRL_DEL = dict.fromkeys([*range(0x20), 0x7F])
+
 def _clean(s: str) -> str:
-    return re.sub(r'[^\x20-\x7E.]', '', s).strip()
+    """Keep printable ASCII only (0x20-0x7E), then strip."""
+    return s.encode('ascii', 'ignore').decode('ascii').translate(_CTRL_DEL).strip()
 
 def _extract_stats(frame: OsdFrame) -> FlightStats:
     """Read flight stats text from the first OSD frame (post-flight stats screen)."""
     s = FlightStats()
 
-    def row_text(r: int) -> str:
-        row = frame.grid[r * GRID_COLS:(r + 1) * GRID_COLS]
-        return ''.join(chr(c) if 32 <= c < 127 else ' ' for c in row)
+    # Whole screen → text in one gather + decode, then split into rows
+    text  = _ASCII_LUT[np.asarray(frame.grid)].tobytes().decode('ascii')
+    lines = [text[r * GRID_COLS:(r + 1) * GRID_COLS] for r in range(GRID_ROWS)]
 
     def after_colon(line: str) -> str:
         idx = line.find(':')
         return line[idx + 1:].strip() if idx >= 0 else ''
 
-    for r in range(GRID_ROWS):
-        line = row_text(r)
+    for line in lines:
+        has_min = 'MIN' in line   # shared by the battery, RSSI and current rows
         if ('TOTAL' in line and 'ARM' in line) or \
            ('FLY'   in line and 'TIME' in line) or \
            ('FLIGHT' in line and 'TIME' in line):
             s.total_arm_time = _clean(after_colon(line)) or None
-        elif 'MIN' in line and 'BATTERY' in line:
+        elif has_min and 'BATTERY' in line:
             try:
                 s.min_battery_v = float(_clean(after_colon(line)).split()[0])
             except Exception:
                 pass
-        elif 'MIN' in line and 'RSSI' in line:
+        elif has_min and 'RSSI' in line:
             try:
                 s.min_rssi_pct = int(
                     float(_clean(after_colon(line)).replace('%', '').split()[0]))
             except Exception:
                 pass
-        elif 'CURRENT' in line and 'MIN' not in line:
+        elif 'CURRENT' in line and not has_min:
             try:
                 raw = _clean(after_colon(line)).split()[0].rstrip('aA')
                 s.max_current_a = round(float(raw), 2)
             except Exception:
                 pass
-        elif ('USED' in line and 'MAH' in line) or \
-             ('USED' in line and 'CAPACITY' in line):
+        elif 'USED' in line and ('MAH' in line or 'CAPACITY' in line):
             try:
                 s.used_mah = int(float(_clean(after_colon(line)).split()[0]))
             except Exception:
@@ -167,33 +217,43 @@ def _extract_stats(frame: OsdFrame) -> FlightStats:
 # ── Main parser ────────────────────────────────────────────────────────────────
 
 def parse_osd(path: str) -> OsdFile:
+    # Map rather than read: the frame array below is a view of the mapping, so
+    # the file is never copied and the OS pages it in (and out) on demand
     with open(path, 'rb') as f:
-        raw = f.read()
-
-    if len(raw) < HEADER_SIZE:
-        raise ValueError("File too small to be a valid OSD file")
+        if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+            raise ValueError("File too small to be a valid OSD file")
+        raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
     fc_tag  = raw[:4]
-    fc_type = FC_TYPES.get(fc_tag, fc_tag.decode('ascii', errors='replace').rstrip('\x00'))
-    if not fc_type or fc_type not in FC_TYPES.values():
-        # Accept any 4-char ASCII tag — other systems may use different strings
-        fc_type = fc_tag.decode('ascii', errors='replace').rstrip('\x00') or 'Unknown'
+    # Unknown tags are accepted as-is — other systems may use different strings
+    fc_type = (FC_TYPES.get(fc_tag)
+               or fc_tag.decode('ascii', errors='replace').rstrip('\x00') or 'Unknown')
 
     n_frames = (len(raw) - HEADER_SIZE) // FRAME_SIZE
     if n_frames == 0:
+        raw.close()
         raise ValueError("OSD file contains no frames")
 
-    osd  = OsdFile()
-    fmt  = f'<{CHARS_PER_FRAME}H'
-
-    for i in range(n_frames):
-        off   = HEADER_SIZE + i * FRAME_SIZE
-        ts_ms = struct.unpack_from('<I', raw, off)[0]
-        grid  = list(struct.unpack_from(fmt, raw, off + 4))
-        osd.frames.append(OsdFrame(index=i, time_ms=ts_ms, grid=grid))
-        osd.timestamps.append(ts_ms)
-
-    # Pull stats from first frame (FC shows post-flight stats screen at start)
-    osd.stats = _extract_stats(osd.frames[0])
-    osd.stats.fc_type = fc_type
+    osd = OsdFile()
+    osd._mm = raw
+    try:
+        # Zero-copy view of every frame record; each grid below is a row of it
+        arr   = np.frombuffer(raw, dtype=FRAME_DT, count=n_frames, offset=HEADER_SIZE)
+        grids = arr['grid']
+
+        osd._ts_arr    = arr['ts']
+        osd.timestamps = osd._ts_arr.tolist()
+        osd.frames = [OsdFrame(index=i, time_ms=ts_ms, grid=grids[i])
+                      for i, ts_ms in enumerate(osd.timestamps)]
+
+        # Pull stats from first frame (FC shows post-flight stats screen at start)
+        osd.stats = _extract_stats(osd.frames[0])
+        osd.stats.fc_type = fc_type
+    except Exception as e:
+        # Drop every view of the mapping (ours and the failed callees') so the
+        # unmap goes through and the file is not left open
+        arr = grids = None
+        traceback.clear_frames(e.__traceback__)
+        osd.close()
+        raise
     return osd
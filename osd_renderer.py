@@ -69,7 +69,9 @@ def render_osd_frame(
     if not PIL_OK:
         return frame_img
 
-    out = frame_img.copy().convert("RGBA")
+    # convert() always returns a new image (a plain copy if already RGBA),
+    # so the caller's frame is never drawn on — no separate .copy() needed
+    out = frame_img.convert("RGBA")
 
     if osd_frame is not None:
         eff, x0, y0 = _auto_scale(out.width, out.height,
@@ -102,7 +104,7 @@ def render_fallback(
 ) -> "Image.Image":
     if not PIL_OK:
         return frame_img
-    out  = frame_img.copy().convert("RGBA")
+    out  = frame_img.convert("RGBA")
     draw = ImageDraw.Draw(out)
     try:    pil_f = PILFont.truetype("arial.ttf", 14)
     except: pil_f = PILFont.load_default()
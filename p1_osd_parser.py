@@ -33,6 +33,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 import os
 
+import numpy as np
+
 # ── Constants ─────────────────────────────────────────────────────────────────
 
 P1_SEI_UUID = bytes.fromhex("bde945dcb748d9e620d82c96efee23d9")
@@ -365,17 +367,20 @@ def p1_to_osd_file(p1: "P1OsdData") -> "OsdFile":
 
     osd = OsdFile()
 
+    # One shared uint16 block for every frame, as parse_osd produces
+    grids = np.zeros((len(p1.frames), GRID_ROWS, GRID_COLS), dtype=np.uint16)
     for i, p1f in enumerate(p1.frames):
-        flat = [0] * (GRID_COLS * GRID_ROWS)
-        for r, row_bytes in enumerate(p1f.grid):
-            if r >= GRID_ROWS:
-                break
-            for c, ch in enumerate(row_bytes):
-                if c >= GRID_COLS:
-                    break
-                flat[r * GRID_COLS + c] = ch
-        osd.frames.append(OsdFrame(index=i, time_ms=p1f.time_ms, grid=flat))
-        osd.timestamps.append(p1f.time_ms)
+        for r, row_bytes in enumerate(p1f.grid[:GRID_ROWS]):
+            row = np.frombuffer(bytes(row_bytes[:GRID_COLS]), dtype=np.uint8)
+            grids[i, r, :len(row)] = row
+    flat = grids.reshape(len(p1.frames), GRID_COLS * GRID_ROWS)
+
+    # Sized once up front rather than grown by append
+    n = len(p1.frames)
+    osd.timestamps = [p1f.time_ms for p1f in p1.frames]
+    osd.frames     = [None] * n
+    for i in range(n):
+        osd.frames[i] = OsdFrame(index=i, time_ms=osd.timestamps[i], grid=flat[i])
 
     # Extract flight stats from the last frame (P1 shows stats at end of flight)
     if osd.frames:
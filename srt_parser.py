@@ -20,6 +20,8 @@ We parse generically: extract any recognisable values, skip
 status bar.
 """
 
+import bisect
+import itertools
 import re
 from dataclasses import dataclass, field
 from typing import Optional
@@ -97,13 +99,21 @@ class SrtEntry:
 class SrtFile:
     entries:     list[SrtEntry] = field(default_factory=list)
     duration_ms: int = 0
+    starts:      list[int]      = field(default_factory=list)  # ms, ascending
+    max_ends:    list[int]      = field(default_factory=list)  # running max of end_ms
 
     def get_data_at_time(self, timestamp_ms: int) -> Optional[TelemetryData]:
-        """Return telemetry for the SRT entry active at timestamp_ms."""
-        # Binary-search-friendly: entries are in order
-        for e in self.entries:
-            if e.start_ms <= timestamp_ms < e.end_ms:
-                return e.telemetry
+        """Return telemetry for the first SRT entry active at timestamp_ms.
+
+        Overlapping cues are allowed: of those covering timestamp_ms, the
+        earliest-starting one wins.
+        """
+        # Entries [0, i] start at or before timestamp_ms; the first of them
+        # still running is where the running max of end_ms passes it
+        i = bisect.bisect_right(self.starts, timestamp_ms) - 1
+        j = bisect.bisect_right(self.max_ends, timestamp_ms)
+        if j <= i:
+            return self.entries[j].telemetry
         return None
 
 
@@ -275,6 +285,9 @@ def parse_srt(path: str) -> SrtFile:
     _flush()  # handle file without trailing blank line
 
     if srt.entries:
-        srt.duration_ms = srt.entries[-1].end_ms
+        srt.entries.sort(key=lambda e: e.start_ms)   # stable — file order on ties
+        srt.starts = [e.start_ms for e in srt.entries]
+        srt.max_ends = list(itertools.accumulate((e.end_ms for e in srt.entries), max))
+        srt.duration_ms = srt.max_ends[-1]   # a longer, earlier cue may end last
 
     return srt
@@ -61,6 +61,12 @@ class Swatch(QWidget):
 
 # ─── One row: token label + swatch + hex input ────────────────────────────────
 
+# Hex field sheets, built once — _on_text only swaps them when validity flips
+_EDIT_OK_SS  = ("background:#1a1a28;color:#e0e0d8;"
+                "border:1px solid #404050;border-radius:4px;padding:2px 6px;")
+_EDIT_BAD_SS = ("background:#1a1a28;color:#f38ba8;"
+                "border:1px solid #f38ba8;border-radius:4px;padding:2px 6px;")
+
 class ColourRow(QWidget):
     changed = pyqtSignal(str, str)   # (token_key, new_hex)
 
@@ -90,10 +96,8 @@ class ColourRow(QWidget):
         self.edit.setFixedWidth(82)
         self.edit.setMaxLength(9)
         self.edit.setFont(QFont("Consolas,Courier New", 11))
-        self.edit.setStyleSheet(
-            "background:#1a1a28;color:#e0e0d8;"
-            "border:1px solid #404050;border-radius:4px;padding:2px 6px;"
-        )
+        self.edit.setStyleSheet(_EDIT_OK_SS)
+        self._valid = True
         self.edit.textChanged.connect(self._on_text)
         row.addWidget(self.edit)
 
@@ -125,19 +129,13 @@ class ColourRow(QWidget):
     def _on_text(self, text: str):
         if not text.startswith("#"):
             text = "#" + text
-        c = QColor(text)
-        if c.isValid():
-            self.edit.setStyleSheet(
-                "background:#1a1a28;color:#e0e0d8;"
-                "border:1px solid #404050;border-radius:4px;padding:2px 6px;"
-            )
+        valid = QColor(text).isValid()
+        if valid != self._valid:
+            self._valid = valid
+            self.edit.setStyleSheet(_EDIT_OK_SS if valid else _EDIT_BAD_SS)
+        if valid:
             self.swatch.set_color(text)
             self.changed.emit(self._key, text)
-        else:
-            self.edit.setStyleSheet(
-                "background:#1a1a28;color:#f38ba8;"
-                "border:1px solid #f38ba8;border-radius:4px;padding:2px 6px;"
-            )
 
 
 # ─── One palette column ───────────────────────────────────────────────────────
@@ -36,6 +36,8 @@ import tempfile
 from dataclasses import dataclass
 from typing import Optional, Callable
 
+import numpy as np
+
 try:
     from PIL import Image
     PIL_OK = True
@@ -85,10 +87,16 @@ class ProcessingConfig:
     trim_start:    float = 0.0    # seconds, 0 = beginning
     trim_end:      float = 0.0    # seconds, 0 = end of file
     upscale_target: str  = ""     # "" = no upscale | "1440p" | "2.7k" | "4k"
+    quality_mode:  str   = "balanced"  # "draft" | "balanced" | "final" — encoder speed
     osd_data:      object = None  # pre-parsed OsdFile (e.g. P1 embedded OSD)
     osd_offset_ms: int   = 0     # Manual OSD sync offset (ms); positive = OSD forward
 
 
+# ProcessingConfig.quality_mode → hardware encoder preset ("balanced" = the old fixed one)
+_NVENC_PRESETS = {"draft": "p1", "balanced": "p6", "final": "p7"}
+_QSV_PRESETS   = {"draft": "veryfast", "balanced": "medium", "final": "slow"}
+
+
 # ── GPU encoder detection ─────────────────────────────────────────────────────
 
 _HW_CANDIDATES = [
@@ -278,10 +286,13 @@ def get_video_info(video_path: str) -> dict:
         return {"error": str(e)}
 
 
-def get_frame_pts(video_path: str, trim_start: float = 0.0) -> list:
+def get_frame_pts(video_path: str, trim_start: float = 0.0,
+                  trim_end: float = 0.0) -> list:
     """Return per-frame PTS list (seconds relative to trim_start) via ffprobe.
 
     Reads only frame metadata — runs at ~5,000–20,000 fps (< 2 s for a 1 h video).
+    Only the trim window is probed: -read_intervals seeks to the keyframe
+    before trim_start instead of walking every frame before it.
     Returns an empty list on any error; caller must fall back to i/fps in that case.
     """
     ffprobe = shutil.which("ffprobe")
@@ -293,7 +304,13 @@ def get_frame_pts(video_path: str, trim_start: float = 0.0) -> list:
                 ffprobe = candidate
     if not ffprobe:
         return []
-    cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0",
+    # Back off 2 s so the seek lands on a keyframe at or before trim_start;
+    # frames before trim_start are still filtered out below
+    interval = f"{max(0.0, trim_start - 2.0):.3f}%"
+    if trim_end > 0:
+        interval += f"{trim_end + 1.0:.3f}"
+    cmd = [ffprobe, "-v", "error", "-select_streams", "v:0",
+           "-read_intervals", interval,
            "-show_entries", "frame=best_effort_timestamp_time",
            "-of", "csv=p=0", video_path]
     try:
@@ -330,6 +347,41 @@ def _drain(pipe, store: list):
     store[0] = b"".join(chunks).decode("utf-8", errors="replace")
 
 
+class RenderCancelled(Exception):
+    """Raised by process_video() when its cancel_event is set."""
+
+
+def _watch_cancel(cancel_event, procs):
+    """Terminate procs as soon as cancel_event is set; exits once they finish."""
+    if cancel_event is None:
+        return
+    def _watch():
+        while not cancel_event.wait(0.1):
+            if all(p.poll() is not None for p in procs):
+                return
+        for p in procs:
+            if p.poll() is None:
+                try: p.terminate()
+                except Exception: pass
+    threading.Thread(target=_watch, daemon=True).start()
+
+
+def _raise_if_cancelled(cancel_event, procs, output):
+    """On cancel: stop ffmpeg, drop the partial output, raise RenderCancelled."""
+    if cancel_event is None or not cancel_event.is_set():
+        return
+    for p in procs:
+        if p.poll() is None:
+            try: p.terminate()
+            except Exception: pass
+        p.wait()
+    try:
+        os.remove(output)
+    except OSError:
+        pass
+    raise RenderCancelled()
+
+
 def _read_exactly(pipe, n: int) -> Optional[bytes]:
     buf = bytearray()
     while len(buf) < n:
@@ -345,6 +397,7 @@ def _read_exactly(pipe, n: int) -> Optional[bytes]:
 def process_video(
     config: ProcessingConfig,
     progress_callback: Optional[Callable[[int, str], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> bool:
     ffmpeg = find_ffmpeg()
     if not ffmpeg:
@@ -381,19 +434,6 @@ def process_video(
         except Exception as e:
             if progress_callback: progress_callback(0, f"⚠ Font: {e}")
 
-    if osd_data is None and srt_data is None:
-        return _reencode_only(ffmpeg, config, progress_callback)
-
-    # ── Video info ─────────────────────────────────────────────────────────────
-    info = get_video_info(config.input_video)
-    if "error" in info or not info.get("width"):
-        raise RuntimeError(f"Cannot read video: {info.get('error','unknown')}")
-
-    width    = info["width"]
-    height   = info["height"]
-    fps      = info["fps"]
-    duration = info["duration"]
-
     # ── Resolve encoder ────────────────────────────────────────────────────────
     hw_info  = detect_hw_encoder(ffmpeg) if config.use_hw else None
     use_vaapi = hw_info and hw_info.get("vaapi", False)
@@ -437,8 +477,12 @@ def process_video(
                 quality_args = ["-b:v", f"{config.bitrate_mbps}M"]
             else:
                 quality_args = ["-cq", str(config.crf)]
-        preset_args = ["-preset", "p6"] if "nvenc" in encoder else \
-                      (["-preset", "medium"] if "qsv" in encoder else [])
+        if "nvenc" in encoder:
+            preset_args = ["-preset", _NVENC_PRESETS.get(config.quality_mode, "p6")]
+        elif "qsv" in encoder:
+            preset_args = ["-preset", _QSV_PRESETS.get(config.quality_mode, "medium")]
+        else:
+            preset_args = []
         # pix_fmt_args: for hardware encoders the filter_complex format= node
         # already delivers the correct pixel format to the encoder — passing
         # -pix_fmt after -c:v confuses NVENC on Linux ("Operation not permitted")
@@ -465,9 +509,32 @@ def process_video(
                             "-bufsize", f"{config.bitrate_mbps * 2:.1f}M"]
         else:
             quality_args = ["-crf", str(config.crf)]
-        preset_args  = ["-preset", config.preset]
+        if config.quality_mode == "draft":
+            # No lookahead / B-frames; short GOP keeps x265 from searching far
+            preset_args = ["-preset", "veryfast", "-tune", "zerolatency"]
+            if encoder == "libx265":
+                preset_args += ["-x265-params", "keyint=30"]
+        elif config.quality_mode == "final":
+            preset_args = ["-preset", "slow"]
+        else:
+            preset_args = ["-preset", config.preset]
         pix_fmt_args = ["-pix_fmt", "yuv420p"]
 
+    if osd_data is None and srt_data is None:
+        return _reencode_only(ffmpeg, config,
+                              encoder, enc_label, quality_args, preset_args, pix_fmt_args,
+                              use_vaapi, progress_callback, cancel_event)
+
+    # ── Video info ─────────────────────────────────────────────────────────────
+    info = get_video_info(config.input_video)
+    if "error" in info or not info.get("width"):
+        raise RuntimeError(f"Cannot read video: {info.get('error','unknown')}")
+
+    width    = info["width"]
+    height   = info["height"]
+    fps      = info["fps"]
+    duration = info["duration"]
+
     # ── Choose pipeline ────────────────────────────────────────────────────────
     # Fast path: OSD overlay pipe — Python handles ONLY the OSD frames,
     # FFmpeg handles all video frame I/O natively in C.
@@ -476,14 +543,30 @@ def process_video(
             ffmpeg, config, osd_data, srt_data, font,
             width, height, fps, duration,
             encoder, enc_label, quality_args, preset_args, pix_fmt_args,
-            use_vaapi, hw_info, progress_callback)
+            use_vaapi, hw_info, progress_callback, cancel_event)
 
     # Fallback: SRT-only (no OSD font) — just burn SRT bar via Python
     return _srt_only_pipeline(
         ffmpeg, config, srt_data,
         width, height, fps, duration,
         encoder, enc_label, quality_args, preset_args, pix_fmt_args,
-        progress_callback)
+        progress_callback, cancel_event)
+
+
+# ── GPU decode to match a GPU encoder ─────────────────────────────────────────
+
+def _hwaccel_input_args(encoder: str) -> list:
+    """Input options that move decoding onto the same GPU as `encoder`.
+
+    No -hwaccel_output_format: the OSD overlay runs on the CPU, so decoded
+    frames are downloaded to system memory anyway.  If the device can't
+    decode the stream, ffmpeg falls back to software decoding by itself.
+    """
+    if "nvenc" in encoder:
+        return ["-hwaccel", "cuda"]
+    if "vaapi" in encoder:
+        return ["-hwaccel", "vaapi", "-hwaccel_device", "/dev/dri/renderD128"]
+    return []
 
 
 # ── Upscale target → filter string ───────────────────────────────────────────
@@ -508,7 +591,7 @@ def _overlay_pipeline(
     ffmpeg, config, osd_data, srt_data, font,
     width, height, fps, duration,
     encoder, enc_label, quality_args, preset_args, pix_fmt_args,
-    use_vaapi, hw_info, progress_callback,
+    use_vaapi, hw_info, progress_callback, cancel_event=None,
 ):
     """
     Python renders OSD frames (~10fps) → pipe to FFmpeg as a second input.
@@ -540,8 +623,7 @@ def _overlay_pipeline(
     # OSD availability check — warn if no OSD frames overlap the trim window
     t_start_ms = int(_t_start * 1000)
     t_end_ms   = int(_t_end   * 1000)
-    osd_in_window = [fr for fr in osd_data.frames
-                     if t_start_ms <= fr.time_ms <= t_end_ms + 500]
+    osd_in_window = osd_data.has_frames_between(t_start_ms, t_end_ms + 500)
     osd_trimmed_warning = ""
     if not osd_in_window:
         osd_trimmed_warning = "No OSD elements in trim window — rendered without OSD overlay"
@@ -557,7 +639,8 @@ def _overlay_pipeline(
     # ── PTS extraction (fast metadata-only ffprobe) ───────────────────────────
     # Fetch actual presentation timestamps so OSD stays locked after video gaps
     # (dropped packets → frozen frames in CFR output → i/fps drifts away).
-    pts_list = get_frame_pts(config.input_video, _t_start)
+    pts_list = get_frame_pts(config.input_video, _t_start,
+                             _t_end if _t_end < duration - 0.01 else 0.0)
     use_pts  = len(pts_list) >= n_out_frames
 
     if use_pts:
@@ -597,7 +680,8 @@ def _overlay_pipeline(
     ffmpeg_cmd = (
         [ffmpeg, "-y"]
         + (["-vaapi_device", "/dev/dri/renderD128"] if use_vaapi else [])
-        # Input 0: source video (with optional fast seek)
+        # Input 0: source video (with optional fast seek, GPU-decoded if encoding on GPU)
+        + _hwaccel_input_args(encoder)
         + _trim_ss + ["-i", config.input_video] + _trim_t
         # Input 1: OSD overlay pipe — rgba frames at video fps
         + ["-f", "rawvideo", "-pix_fmt", "rgba",
@@ -626,6 +710,7 @@ def _overlay_pipeline(
     threading.Thread(target=_drain, args=(ffmpeg_proc.stderr, _overlay_stderr_store),
                      daemon=True).start()
     ffmpeg_stderr = _overlay_stderr_store
+    _watch_cancel(cancel_event, [ffmpeg_proc])
 
     # ── OSD render loop ───────────────────────────────────────────────────────
     # For each output video frame i, compute its absolute timestamp, look up
@@ -649,14 +734,21 @@ def _overlay_pipeline(
             if progress_callback:
                 progress_callback(50, f"No OSD in trim window — blank overlay  [{enc_label}]")
         else:
-            for i in range(n_out_frames):
-                # Absolute timestamp of this video frame in the OSD file's timebase.
-                # use_pts: real PTS from ffprobe (handles gaps/dropped packets).
-                # Fallback: i/fps (constant-rate assumption, current legacy behaviour).
-                t_sec    = pts_list[i] if use_pts else i / fps
-                abs_t_ms = int((_t_start + t_sec) * 1000 + config.osd_offset_ms)
+            # Absolute timestamp of every video frame in the OSD file's timebase.
+            # use_pts: real PTS from ffprobe (handles gaps/dropped packets).
+            # Fallback: i/fps (constant-rate assumption, current legacy behaviour).
+            t_secs = (np.asarray(pts_list[:n_out_frames], dtype=np.float64) if use_pts
+                      else np.arange(n_out_frames) / fps)
+            abs_ms = ((_t_start + t_secs) * 1000 + config.osd_offset_ms).astype(np.int64)
+            # Every frame's OSD lookup in one searchsorted instead of a bisect each
+            osd_idx = osd_data.frame_indices_for_times(abs_ms).tolist()
+            abs_ms  = abs_ms.tolist()
 
-                osd_frame = osd_data.frame_at_time(abs_t_ms)
+            for i in range(n_out_frames):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                abs_t_ms  = abs_ms[i]
+                osd_frame = osd_data.frames[osd_idx[i]]
 
                 srt_text = ""
                 if srt_data and config.show_srt_bar:
@@ -693,11 +785,14 @@ def _overlay_pipeline(
         except Exception:
             pass
 
+    _raise_if_cancelled(cancel_event, [ffmpeg_proc], config.output_video)
+
     # Wait for FFmpeg to finish encoding (it may still be processing video)
     if progress_callback:
         progress_callback(92, f"Encoding…  [{enc_label}]")
 
     ffmpeg_proc.wait()
+    _raise_if_cancelled(cancel_event, [ffmpeg_proc], config.output_video)
 
     if ffmpeg_proc.returncode not in (0, None):
         err = ffmpeg_stderr[0]
@@ -723,7 +818,7 @@ def _srt_only_pipeline(
     ffmpeg, config, srt_data,
     width, height, fps, duration,
     encoder, enc_label, quality_args, preset_args, pix_fmt_args,
-    progress_callback,
+    progress_callback, cancel_event=None,
 ):
     """SRT text bar rendered in Python, piped through the old frame-by-frame path."""
     import sys
@@ -743,7 +838,7 @@ def _srt_only_pipeline(
     if progress_callback:
         progress_callback(5, f"{width}×{height} @ {fps}fps · SRT only · {enc_label}")
 
-    decode_cmd = ([ffmpeg, "-y"]
+    decode_cmd = ([ffmpeg, "-y"] + _hwaccel_input_args(encoder)
                   + _trim_ss + ["-i", config.input_video] + _trim_t
                   + ["-f", "rawvideo", "-pix_fmt", "rgba", "pipe:1"])
     srt_movflags = ["-movflags", "+faststart"]
@@ -765,13 +860,14 @@ def _srt_only_pipeline(
     enc_stderr = [""]
     threading.Thread(target=_drain, args=(dec_proc.stderr, [""]), daemon=True).start()
     threading.Thread(target=_drain, args=(enc_proc.stderr, enc_stderr), daemon=True).start()
+    _watch_cancel(cancel_event, [dec_proc, enc_proc])
 
     frame_idx    = 0
     t_offset_ms  = int(_t_start * 1000)   # SRT timestamps are absolute
     total_trimmed = max(1, int(_t_dur * fps))
     report_every = max(1, total_trimmed // 200)
     try:
-        while True:
+        while cancel_event is None or not cancel_event.is_set():
             raw = _read_exactly(dec_proc.stdout, frame_bytes)
             if raw is None: break
             # Offset frame time by trim_start so SRT lookup uses absolute timestamp
@@ -797,7 +893,9 @@ def _srt_only_pipeline(
         try: enc_proc.stdin.close()
         except Exception: pass
 
+    _raise_if_cancelled(cancel_event, [dec_proc, enc_proc], config.output_video)
     dec_proc.wait(); enc_proc.wait()
+    _raise_if_cancelled(cancel_event, [dec_proc, enc_proc], config.output_video)
 
     if enc_proc.returncode not in (0, None):
         err = enc_stderr[0]
@@ -809,23 +907,46 @@ def _srt_only_pipeline(
     return True
 
 
-def _reencode_only(ffmpeg, config, progress_callback):
+def _reencode_filter(encoder: str, use_vaapi: bool) -> list:
+    """-vf for a re-encode without an overlay graph.
+
+    VAAPI encoders take hardware frames — upload as in _upscale_filter.
+    NVENC and AMF get no -pix_fmt (see process_video), so with no
+    filter_complex format= node they need the conversion here instead.
+    """
+    if use_vaapi:
+        return ["-vf", "format=nv12,hwupload"]
+    if "nvenc" in encoder or "amf" in encoder:
+        return ["-vf", "format=nv12"]
+    return []
+
+
+def _reencode_only(ffmpeg, config,
+                   encoder, enc_label, quality_args, preset_args, pix_fmt_args,
+                   use_vaapi, progress_callback, cancel_event=None):
     if progress_callback:
-        progress_callback(5, "Re-encoding…")
+        progress_callback(5, f"Re-encoding…  [{enc_label}]")
     _t_start = config.trim_start if config.trim_start > 0.01 else 0.0
     _t_end   = config.trim_end   if config.trim_end   > 0.01 else 0.0
     _trim_ss = ["-ss", f"{_t_start:.3f}"] if _t_start > 0.01 else []
-    _trim_to = ["-to", f"{_t_end:.3f}"]   if _t_end   > 0.01 else []
-    cmd = ([ffmpeg, "-y"] + _trim_ss + ["-i", config.input_video] + _trim_to
+    # -ss is an input (keyframe) seek, which resets timestamps to 0, so the end
+    # has to be a duration — "-to trim_end" would run trim_start seconds long
+    _trim_to = ["-t", f"{_t_end - _t_start:.3f}"] if _t_end > 0.01 else []
+    cmd = ([ffmpeg, "-y"]
+           + (["-vaapi_device", "/dev/dri/renderD128"] if use_vaapi else [])
+           + _hwaccel_input_args(encoder)
+           + _trim_ss + ["-i", config.input_video] + _trim_to
            + ["-sws_flags", "lanczos+accurate_rnd+full_chroma_int"]
-           + ["-c:v", config.codec, "-crf", str(config.crf),
-              "-preset", config.preset,
-              "-movflags", "+faststart",
+           + _reencode_filter(encoder, use_vaapi)
+           + ["-c:v", encoder] + quality_args + preset_args + pix_fmt_args
+           + ["-movflags", "+faststart",
               "-c:a", "copy", config.output_video])
     stderr_store = [""]
     proc = _hidden_popen(cmd, stderr=subprocess.PIPE, bufsize=0)
     threading.Thread(target=_drain, args=(proc.stderr, stderr_store), daemon=True).start()
+    _watch_cancel(cancel_event, [proc])
     proc.wait()
+    _raise_if_cancelled(cancel_event, [proc], config.output_video)
     if proc.returncode != 0:
         err = stderr_store[0]
         if isinstance(err, bytes): err = err.decode("utf-8", errors="replace")